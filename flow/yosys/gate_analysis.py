@@ -6,203 +6,270 @@ Analyzes synthesized netlists and synthesis statistics to extract detailed gate
 Enhanced to work with individual module synthesis results and generate comprehensive reports.
 """
 
+import io
 import re
+import mmap
 import sys
 import os
 import json
 import argparse
-from pathlib import Path
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterator, Optional
 
-def parse_synthesis_stats(stats_file: str) -> Optional[Dict[str, Any]]:
-    """Parse synthesis statistics from Yosys output files."""
-    if not os.path.exists(stats_file):
-        return None
-    
-    with open(stats_file, 'r') as f:
-        content = f.read()
-    
+# Synthesis statistics keys by Yosys label
+_STAT_KEYS = {
+    'cells': 'cells',
+    'wires': 'wires',
+    'wire bits': 'wire_bits',
+    'public wires': 'public_wires',
+    'public wire bits': 'public_wire_bits',
+    'ports': 'ports',
+    'port bits': 'port_bits',
+    'memories': 'memories',
+    'memory bits': 'memory_bits',
+    'processes': 'processes',
+}
+
+# Gate types by Yosys primitive cell name
+_GATE_TYPES = {
+    'AND': 'AND',
+    'OR': 'OR',
+    'XOR': 'XOR',
+    'XNOR': 'XNOR',
+    'ANDNOT': 'ANDNOT',
+    'NAND': 'NAND',
+    'NOR': 'NOR',
+    'NOT': 'NOT',
+    'MUX': 'MUX',
+    'DFF': 'DFF',
+    'DFFE': 'DFFE',
+    'DLATCH': 'LATCH',
+    'ALDFFE': 'ALDFFE',
+    'MUL': 'MUL',
+    'ADD': 'ADD',
+    'SUB': 'SUB',
+    'ROM': 'ROM',
+    'RAM': 'RAM',
+}
+
+_CELL_NAMES = '|'.join(_GATE_TYPES)
+
+# Single-pass patterns (compiled once at module load)
+_STATS_RX = re.compile(r'Number of (?P<key>' + '|'.join(_STAT_KEYS) + r'):\s+(?P<val>\d+)')
+_CELLS_RX = re.compile(r'\\\$_(?P<gate>' + _CELL_NAMES + r')_\s+(?P<count>\d+)')
+
+# Literal netlist tokens for each gate instance ("\$_AND_ " or "\$_AND_<tab>")
+_GATE_TOKENS = [(gate_type, (b'\\$_' + cell.encode() + b'_ ', b'\\$_' + cell.encode() + b'_\t'))
+                for cell, gate_type in _GATE_TYPES.items()]
+
+# Module instance pattern for netlists; Yosys writes "type name (" on one
+# line, so a match never spans a newline or a line-aligned window boundary
+_MODULE_PATTERN = re.compile(rb'(\w+)[ \t]+(\w+)[ \t]*\(')
+
+# Netlists are scanned in line-aligned windows of this many bytes
+_NETLIST_CHUNK_SIZE = 1 << 22
+
+# Verilog keywords that match the module instance pattern; primitive
+# gates are excluded separately by their '\$_' prefix
+_KEYWORD_EXCLUDE = frozenset({'module', 'input', 'output', 'wire'})
+
+# Primitive cells that do not make a design hierarchical
+_PRIMITIVE_EXCLUDE = frozenset({'\\$_AND_', '\\$_OR_', '\\$_XOR_', '\\$_XNOR_', '\\$_ANDNOT_'})
+
+# Gate types counted as sequential elements
+_SEQUENTIAL_GATES = frozenset({'DFF', 'DFFE', 'LATCH', 'ALDFFE'})
+
+# Approximate transistor cost per gate type
+_TRANSISTOR_COST = {
+    'AND': 6,      # 2-input AND: 6 transistors
+    'OR': 6,       # 2-input OR: 6 transistors
+    'XOR': 8,      # 2-input XOR: 8 transistors
+    'XNOR': 8,     # 2-input XNOR: 8 transistors
+    'ANDNOT': 4,   # AND-NOT: 4 transistors
+    'NAND': 4,     # 2-input NAND: 4 transistors
+    'NOR': 4,      # 2-input NOR: 4 transistors
+    'NOT': 2,      # NOT: 2 transistors
+    'MUX': 12,     # 2:1 MUX: 12 transistors
+    'DFF': 20,     # DFF: ~20 transistors
+    'DFFE': 24,    # DFFE: ~24 transistors (with enable)
+    'LATCH': 12,   # Latch: ~12 transistors
+    'ALDFFE': 28,  # ALDFFE: ~28 transistors (async load, enable)
+    'MUL': 200,    # Multiplier: ~200 transistors (approximate)
+    'ADD': 50,     # Adder: ~50 transistors (approximate)
+    'SUB': 50,     # Subtractor: ~50 transistors (approximate)
+    'ROM': 100,    # ROM: ~100 transistors per bit (approximate)
+    'RAM': 150     # RAM: ~150 transistors per bit (approximate)
+}
+
+# Per-module report metadata, in report order
+_MODULE_META = {
+    'fft_engine': {
+        'display': 'FFT Engine',
+        'components': 'Butterfly operations, pipeline',
+        'area': 'butterfly operations and pipeline',
+        'quality': ('✅ PASS', '~30s', 'Excellent'),
+    },
+    'fft_control': {
+        'display': 'FFT Control',
+        'components': 'FSM, control logic',
+        'area': 'FSM and control logic',
+        'quality': ('✅ PASS', '~30s', 'Excellent'),
+    },
+    'rescale_unit': {
+        'display': 'Rescale Unit',
+        'components': 'Overflow detection, scaling logic',
+        'area': 'complex arithmetic operations',
+        'quality': ('✅ PASS', '~30s', 'Excellent'),
+    },
+    'scale_factor_tracker': {
+        'display': 'Scale Factor Tracker',
+        'components': 'Scale factor tracking logic',
+        'area': 'scale factor tracking',
+        'quality': ('✅ PASS', '~30s', 'Excellent'),
+    },
+    'twiddle_rom': {
+        'display': 'Twiddle ROM',
+        'components': '2048-entry ROM, address logic',
+        'area': '2048-entry ROM (efficient)',
+        'quality': ('✅ PASS', '~60s', 'Good'),
+    },
+    'memory_interface': {
+        'display': 'Memory Interface',
+        'components': 'APB interface (reduced memory)',
+        'area': 'APB interface (simplified)',
+        'quality': ('⚠️ PARTIAL', '~30s', 'Simplified'),
+    },
+}
+
+# Markdown sections shared by both report generators
+_TRADEOFFS_MD = """\
+- **Performance**: {performance}
+- **Area**: Optimized for ASIC implementation
+- **Power**: Pipeline design for power efficiency
+- **Flexibility**: Configurable FFT size and scaling
+- **Memory**: Efficient memory usage with twiddle factor ROM"""
+
+_POWER_MD = """\
+- **Static Power**: Moderate (sequential elements)
+- **Dynamic Power**: {dynamic}
+- **Clock Power**: Multiple clock domains
+- **Memory Power**: ROM/RAM access patterns"""
+
+_FFT_MD = """\
+- **Butterfly Operations**: Complex arithmetic dominates area
+- **Pipeline Efficiency**: Multi-stage pipeline for throughput
+- **Memory Bandwidth**: Twiddle factor and data memory access
+- **Scaling Logic**: Overflow prevention and scaling control
+- **Control Logic**: FSM for FFT stage management"""
+
+def parse_synthesis_stats_content(content: str) -> Dict[str, Any]:
+    """Parse synthesis statistics from the text of a Yosys stats report."""
     # Extract key statistics
-    stats = {}
-    
-    # Number of cells
-    cell_match = re.search(r'Number of cells:\s+(\d+)', content)
-    if cell_match:
-        stats['cells'] = int(cell_match.group(1))
-    
-    # Number of wires
-    wire_match = re.search(r'Number of wires:\s+(\d+)', content)
-    if wire_match:
-        stats['wires'] = int(wire_match.group(1))
-    
-    # Number of wire bits
-    wire_bits_match = re.search(r'Number of wire bits:\s+(\d+)', content)
-    if wire_bits_match:
-        stats['wire_bits'] = int(wire_bits_match.group(1))
-    
-    # Number of public wires
-    public_wires_match = re.search(r'Number of public wires:\s+(\d+)', content)
-    if public_wires_match:
-        stats['public_wires'] = int(public_wires_match.group(1))
-    
-    # Number of public wire bits
-    public_wire_bits_match = re.search(r'Number of public wire bits:\s+(\d+)', content)
-    if public_wire_bits_match:
-        stats['public_wire_bits'] = int(public_wire_bits_match.group(1))
-    
-    # Number of ports
-    ports_match = re.search(r'Number of ports:\s+(\d+)', content)
-    if ports_match:
-        stats['ports'] = int(ports_match.group(1))
-    
-    # Number of port bits
-    port_bits_match = re.search(r'Number of port bits:\s+(\d+)', content)
-    if port_bits_match:
-        stats['port_bits'] = int(port_bits_match.group(1))
-    
-    # Number of memories
-    memories_match = re.search(r'Number of memories:\s+(\d+)', content)
-    if memories_match:
-        stats['memories'] = int(memories_match.group(1))
-    
-    # Number of memory bits
-    memory_bits_match = re.search(r'Number of memory bits:\s+(\d+)', content)
-    if memory_bits_match:
-        stats['memory_bits'] = int(memory_bits_match.group(1))
-    
-    # Number of processes
-    processes_match = re.search(r'Number of processes:\s+(\d+)', content)
-    if processes_match:
-        stats['processes'] = int(processes_match.group(1))
-    
+    stats: Dict[str, Any] = {}
+    for match in _STATS_RX.finditer(content):
+        stats.setdefault(_STAT_KEYS[match['key']], int(match['val']))
+
     # Extract cell breakdown
-    cell_breakdown = {}
-    cell_patterns = {
-        'AND': r'\\\$_AND_\s+(\d+)',
-        'OR': r'\\\$_OR_\s+(\d+)',
-        'XOR': r'\\\$_XOR_\s+(\d+)',
-        'XNOR': r'\\\$_XNOR_\s+(\d+)',
-        'ANDNOT': r'\\\$_ANDNOT_\s+(\d+)',
-        'NAND': r'\\\$_NAND_\s+(\d+)',
-        'NOR': r'\\\$_NOR_\s+(\d+)',
-        'NOT': r'\\\$_NOT_\s+(\d+)',
-        'MUX': r'\\\$_MUX_\s+(\d+)',
-        'DFF': r'\\\$_DFF_\s+(\d+)',
-        'DFFE': r'\\\$_DFFE_\s+(\d+)',
-        'LATCH': r'\\\$_DLATCH_\s+(\d+)',
-        'ALDFFE': r'\\\$_ALDFFE_\s+(\d+)',
-        'MUL': r'\\\$_MUL_\s+(\d+)',
-        'ADD': r'\\\$_ADD_\s+(\d+)',
-        'SUB': r'\\\$_SUB_\s+(\d+)',
-        'ROM': r'\\\$_ROM_\s+(\d+)',
-        'RAM': r'\\\$_RAM_\s+(\d+)'
-    }
-    
-    for gate_type, pattern in cell_patterns.items():
-        match = re.search(pattern, content)
-        if match:
-            cell_breakdown[gate_type] = int(match.group(1))
+    cell_breakdown: Dict[str, int] = {}
+    for match in _CELLS_RX.finditer(content):
+        cell_breakdown.setdefault(_GATE_TYPES[match['gate']], int(match['count']))
     
     stats['cell_breakdown'] = cell_breakdown
     
     return stats
 
-def analyze_gates(netlist_file):
-    """Analyze gate counts in a synthesized netlist."""
-    if not os.path.exists(netlist_file):
-        print(f"Warning: Netlist file {netlist_file} not found")
-        return None
-    
-    with open(netlist_file, 'r') as f:
+@lru_cache(maxsize=32)
+def _parse_synthesis_stats_cached(stats_file: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a stats file; mtime and size only key the cache."""
+    with open(stats_file, 'r', buffering=65536) as f:
         content = f.read()
     
-    # Count different gate types
-    gate_counts = {}
-    
-    # Find all gate instances
-    gate_patterns = {
-        'AND': r'\\\$_AND_\s+',
-        'OR': r'\\\$_OR_\s+',
-        'XOR': r'\\\$_XOR_\s+',
-        'XNOR': r'\\\$_XNOR_\s+',
-        'ANDNOT': r'\\\$_ANDNOT_\s+',
-        'NAND': r'\\\$_NAND_\s+',
-        'NOR': r'\\\$_NOR_\s+',
-        'NOT': r'\\\$_NOT_\s+',
-        'MUX': r'\\\$_MUX_\s+',
-        'DFF': r'\\\$_DFF_\s+',
-        'DFFE': r'\\\$_DFFE_\s+',
-        'LATCH': r'\\\$_DLATCH_\s+',
-        'ALDFFE': r'\\\$_ALDFFE_\s+',
-        'MUL': r'\\\$_MUL_\s+',
-        'ADD': r'\\\$_ADD_\s+',
-        'SUB': r'\\\$_SUB_\s+',
-        'ROM': r'\\\$_ROM_\s+',
-        'RAM': r'\\\$_RAM_\s+'
-    }
-    
-    for gate_type, pattern in gate_patterns.items():
-        matches = re.findall(pattern, content)
-        if matches:
-            gate_counts[gate_type] = len(matches)
-    
-    # Count module instances (excluding primitive gates)
-    module_instances = {}
-    module_pattern = r'(\w+)\s+(\w+)\s*\('
-    for match in re.finditer(module_pattern, content):
-        module_name = match.group(1)
-        instance_name = match.group(2)
-        # Skip primitive gates and Verilog keywords
-        if (module_name not in ['module', 'input', 'output', 'wire', '\\$_AND_', 
-                               '\\$_OR_', '\\$_XOR_', '\\$_XNOR_', '\\$_ANDNOT_',
-                               '\\$_NAND_', '\\$_NOR_', '\\$_NOT_', '\\$_MUX_',
-                               '\\$_DFF_', '\\$_DFFE_', '\\$_DLATCH_', '\\$_ALDFFE_',
-                               '\\$_MUL_', '\\$_ADD_', '\\$_SUB_', '\\$_ROM_', '\\$_RAM_'] and
-            not module_name.startswith('\\$_')):
-            if module_name not in module_instances:
-                module_instances[module_name] = 0
-            module_instances[module_name] += 1
+    return parse_synthesis_stats_content(content)
+
+def parse_synthesis_stats(stats_file: str) -> Optional[Dict[str, Any]]:
+    """Parse synthesis statistics from Yosys output files.
+    
+    Results are cached per (path, mtime, size) and must be treated as read-only.
+    """
+    try:
+        st = os.stat(stats_file)
+        return _parse_synthesis_stats_cached(stats_file, st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        return None
+
+def _iter_line_chunks(mm: mmap.mmap) -> Iterator[bytes]:
+    """Yield consecutive windows of a mapped file that end on a line boundary."""
+    start = 0
+    end_of_file = len(mm)
+    while start < end_of_file:
+        end = min(start + _NETLIST_CHUNK_SIZE, end_of_file)
+        if end < end_of_file:
+            newline = mm.rfind(b'\n', start, end)
+            if newline >= 0:
+                end = newline + 1
+        yield mm[start:end]
+        start = end
+
+@lru_cache(maxsize=32)
+def _analyze_gates_cached(netlist_file: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Analyze a netlist; mtime and size only key the cache."""
+    # Count different gate types and module instances over line-aligned
+    # windows of the mapped file so large netlists are never held in memory
+    # as a whole; gate instances are literal tokens, so bytes.count suffices
+    gate_counts: Counter[str] = Counter()
+    module_instances: Counter[str] = Counter()
+    
+    with open(netlist_file, 'rb') as f:
+        if size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for chunk in _iter_line_chunks(mm):
+                    # Find all gate instances
+                    for gate_type, tokens in _GATE_TOKENS:
+                        count = sum(chunk.count(token) for token in tokens)
+                        if count:
+                            gate_counts[gate_type] += count
+                    
+                    # Count module instances (excluding primitive gates)
+                    for match in _MODULE_PATTERN.finditer(chunk):
+                        module_name = match.group(1).decode()
+                        instance_name = match.group(2).decode()
+                        # Skip primitive gates and Verilog keywords
+                        if not (module_name in _KEYWORD_EXCLUDE or module_name.startswith('\\$_')):
+                            module_instances[module_name] += 1
     
     # Count total gates (including module instances for hierarchical designs)
     total_primitive_gates = sum(gate_counts.values())
     
     # Calculate transistor counts (approximate)
-    transistor_counts = {
-        'AND': 6,      # 2-input AND: 6 transistors
-        'OR': 6,       # 2-input OR: 6 transistors
-        'XOR': 8,      # 2-input XOR: 8 transistors
-        'XNOR': 8,     # 2-input XNOR: 8 transistors
-        'ANDNOT': 4,   # AND-NOT: 4 transistors
-        'NAND': 4,     # 2-input NAND: 4 transistors
-        'NOR': 4,      # 2-input NOR: 4 transistors
-        'NOT': 2,      # NOT: 2 transistors
-        'MUX': 12,     # 2:1 MUX: 12 transistors
-        'DFF': 20,     # DFF: ~20 transistors
-        'DFFE': 24,    # DFFE: ~24 transistors (with enable)
-        'LATCH': 12,   # Latch: ~12 transistors
-        'ALDFFE': 28,  # ALDFFE: ~28 transistors (async load, enable)
-        'MUL': 200,    # Multiplier: ~200 transistors (approximate)
-        'ADD': 50,     # Adder: ~50 transistors (approximate)
-        'SUB': 50,     # Subtractor: ~50 transistors (approximate)
-        'ROM': 100,    # ROM: ~100 transistors per bit (approximate)
-        'RAM': 150     # RAM: ~150 transistors per bit (approximate)
-    }
-    
-    total_transistors = sum(gate_counts.get(gate, 0) * count 
-                           for gate, count in transistor_counts.items())
+    total_transistors = sum(count * _TRANSISTOR_COST[gate]
+                            for gate, count in gate_counts.items())
     
     return {
-        'gate_counts': gate_counts,
-        'module_instances': module_instances,
+        'gate_counts': dict(gate_counts),
+        'module_instances': dict(module_instances),
         'total_primitive_gates': total_primitive_gates,
         'total_transistors': total_transistors,
         'file': netlist_file
     }
 
-def calculate_die_size_estimates(total_cells: int) -> Dict[str, float]:
+def analyze_gates(netlist_file: str) -> Optional[Dict[str, Any]]:
+    """Analyze gate counts in a synthesized netlist.
+    
+    Results are cached per (path, mtime, size) and must be treated as read-only.
+    """
+    try:
+        st = os.stat(netlist_file)
+        return _analyze_gates_cached(netlist_file, st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        print(f"Warning: Netlist file {netlist_file} not found")
+        return None
+
+def calculate_die_size_estimates(total_cells: int) -> Dict[str, Dict[str, float]]:
     """Calculate die size estimates for different technologies."""
-    estimates = {}
+    estimates: Dict[str, Dict[str, float]] = {}
     
     # ASIC estimates (45nm process)
     gate_density_45nm = 1200000  # gates/mm²
@@ -227,259 +294,187 @@ def calculate_die_size_estimates(total_cells: int) -> Dict[str, float]:
     
     return estimates
 
-def generate_comprehensive_gate_report(synthesis_dir: str = "../synthesis", output_file: str = "gate_analysis_report.md") -> str:
-    """Generate comprehensive gate analysis report from synthesis statistics."""
-    
-    # Define module names and their descriptions
-    modules = {
-        'fft_engine': 'FFT Engine',
-        'fft_control': 'FFT Control', 
-        'rescale_unit': 'Rescale Unit',
-        'scale_factor_tracker': 'Scale Factor Tracker',
-        'twiddle_rom': 'Twiddle ROM',
-        'memory_interface': 'Memory Interface'
-    }
+def _iter_comprehensive_gate_report(synthesis_dir: str) -> Iterator[str]:
+    """Yield the comprehensive gate analysis report line by line."""
     
     # Collect statistics for each module
     module_stats = {}
     total_cells = 0
     
-    for module_name, display_name in modules.items():
-        stats_file = f"{synthesis_dir}/reports/{module_name}_stats.txt"
-        stats = parse_synthesis_stats(stats_file)
+    # Module stats files are independent, so read and parse them concurrently
+    stats_files = [f"{synthesis_dir}/reports/{module_name}_stats.txt"
+                   for module_name in _MODULE_META]
+    with ThreadPoolExecutor(max_workers=len(stats_files)) as executor:
+        all_stats = list(executor.map(parse_synthesis_stats, stats_files))
+    
+    for module_name, stats in zip(_MODULE_META, all_stats):
         if stats:
-            module_stats[display_name] = stats
+            module_stats[module_name] = stats
             total_cells += stats.get('cells', 0)
     
     # Calculate die size estimates
     die_estimates = calculate_die_size_estimates(total_cells)
     
     # Generate report
-    report = []
-    report.append("# Fast Fourier Transform IP Gate-Level Analysis Report")
-    report.append("=" * 65)
-    report.append("")
-    report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append("")
+    yield "# Fast Fourier Transform IP Gate-Level Analysis Report"
+    yield "=" * 65
+    yield ""
+    yield f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    yield ""
     
     # Gate Count Summary
-    report.append("## 📊 Gate Count Summary")
-    report.append("")
-    report.append("| Module | Cells | Wire Bits | Public Wires | Key Components |")
-    report.append("|--------|-------|-----------|--------------|----------------|")
-    
-    for display_name, stats in module_stats.items():
+    yield "## 📊 Gate Count Summary"
+    yield ""
+    yield "| Module | Cells | Wire Bits | Public Wires | Key Components |"
+    yield "|--------|-------|-----------|--------------|----------------|"
+    
+    # Modules without synthesis results are listed in place with '-'
+    for module_name, meta in _MODULE_META.items():
+        stats = module_stats.get(module_name, {})
         cells = stats.get('cells', '-')
         wire_bits = stats.get('wire_bits', '-')
         public_wires = stats.get('public_wires', '-')
-        
-        # Determine key components based on module name
-        if 'FFT Engine' in display_name:
-            components = "Butterfly operations, pipeline"
-        elif 'FFT Control' in display_name:
-            components = "FSM, control logic"
-        elif 'Rescale Unit' in display_name:
-            components = "Overflow detection, scaling logic"
-        elif 'Scale Factor' in display_name:
-            components = "Scale factor tracking logic"
-        elif 'Twiddle ROM' in display_name:
-            components = "2048-entry ROM, address logic"
-        elif 'Memory Interface' in display_name:
-            components = "APB interface (reduced memory)"
-        else:
-            components = "Core logic"
-        
-        report.append(f"| **{display_name}** | {cells} | {wire_bits} | {public_wires} | {components} |")
-    
-    # Add modules that weren't found
-    for display_name in modules.values():
-        if display_name not in module_stats:
-            if 'FFT Engine' in display_name:
-                components = "Butterfly operations, pipeline"
-            elif 'FFT Control' in display_name:
-                components = "FSM, control logic"
-            elif 'Rescale Unit' in display_name:
-                components = "Overflow detection, scaling logic"
-            elif 'Scale Factor' in display_name:
-                components = "Scale factor tracking logic"
-            elif 'Twiddle ROM' in display_name:
-                components = "2048-entry ROM, address logic"
-            elif 'Memory Interface' in display_name:
-                components = "APB interface (reduced memory)"
-            else:
-                components = "Core logic"
-            
-            report.append(f"| **{display_name}** | - | - | - | {components} |")
+        yield f"| **{meta['display']}** | {cells} | {wire_bits} | {public_wires} | {meta['components']} |"
     
-    report.append("")
+    yield ""
     
     # Estimated totals
-    report.append("### **Estimated Total Gate Count:**")
-    report.append(f"- **Reported Modules**: ~{total_cells} cells")
+    yield "### **Estimated Total Gate Count:**"
+    yield f"- **Reported Modules**: ~{total_cells} cells"
     estimated_full = total_cells * 2 if total_cells > 0 else 15000
-    report.append(f"- **Estimated Full Design**: ~{estimated_full} cells")
-    report.append("- **Memory Interface (full)**: Would add ~50,000-100,000 cells")
-    report.append("")
+    yield f"- **Estimated Full Design**: ~{estimated_full} cells"
+    yield "- **Memory Interface (full)**: Would add ~50,000-100,000 cells"
+    yield ""
     
     # Die Size Estimates
-    report.append("## 🏗️ Die Size Estimates")
-    report.append("")
+    yield "## 🏗️ Die Size Estimates"
+    yield ""
     
     # ASIC estimates
     asic = die_estimates['asic_45nm']
-    report.append("### **ASIC Implementation (45nm process):**")
-    report.append(f"- **Gate Density**: ~{asic['gate_density']:,} gates/mm²")
-    report.append(f"- **Logic Area**: ~{asic['logic_area']:.4f} mm² (core logic only)")
-    report.append(f"- **Memory Area**: ~{asic['memory_area']:.1f} mm² (including 256KB memory)")
-    report.append(f"- **Total Estimated Area**: ~{asic['total_area']:.4f} mm²")
-    report.append("")
+    yield "### **ASIC Implementation (45nm process):**"
+    yield f"- **Gate Density**: ~{asic['gate_density']:,} gates/mm²"
+    yield f"- **Logic Area**: ~{asic['logic_area']:.4f} mm² (core logic only)"
+    yield f"- **Memory Area**: ~{asic['memory_area']:.1f} mm² (including 256KB memory)"
+    yield f"- **Total Estimated Area**: ~{asic['total_area']:.4f} mm²"
+    yield ""
     
     # FPGA estimates
     fpga = die_estimates['fpga']
-    report.append("### **FPGA Implementation:**")
-    report.append(f"- **LUT Usage**: ~{fpga['lut_usage']:.0f} LUTs")
-    report.append(f"- **BRAM Usage**: ~{fpga['bram_blocks']} BRAM blocks (for memory)")
-    report.append(f"- **DSP Usage**: ~{fpga['dsp_blocks']} DSP blocks (for arithmetic)")
-    report.append(f"- **FF Usage**: ~{fpga['ff_usage']:.0f} flip-flops")
-    report.append("")
+    yield "### **FPGA Implementation:**"
+    yield f"- **LUT Usage**: ~{fpga['lut_usage']:.0f} LUTs"
+    yield f"- **BRAM Usage**: ~{fpga['bram_blocks']} BRAM blocks (for memory)"
+    yield f"- **DSP Usage**: ~{fpga['dsp_blocks']} DSP blocks (for arithmetic)"
+    yield f"- **FF Usage**: ~{fpga['ff_usage']:.0f} flip-flops"
+    yield ""
     
     # Performance Analysis
-    report.append("## ⚡ Performance Analysis")
-    report.append("")
-    report.append("### **Area Efficiency**")
+    yield "## ⚡ Performance Analysis"
+    yield ""
+    yield "### **Area Efficiency**"
     
-    for display_name, stats in module_stats.items():
+    for module_name, stats in module_stats.items():
+        meta = _MODULE_META[module_name]
         cells = stats.get('cells', 0)
         if cells > 0:
-            if 'FFT Engine' in display_name:
-                report.append(f"- **{display_name}**: {cells} cells for butterfly operations and pipeline")
-            elif 'FFT Control' in display_name:
-                report.append(f"- **{display_name}**: {cells} cells for FSM and control logic")
-            elif 'Rescale Unit' in display_name:
-                report.append(f"- **{display_name}**: {cells} cells for complex arithmetic operations")
-            elif 'Scale Factor' in display_name:
-                report.append(f"- **{display_name}**: {cells} cells for scale factor tracking")
-            elif 'Twiddle ROM' in display_name:
-                report.append(f"- **{display_name}**: {cells} cells for 2048-entry ROM (efficient)")
-            elif 'Memory Interface' in display_name:
-                report.append(f"- **{display_name}**: {cells} cells for APB interface (simplified)")
-    
-    report.append("- **Overall**: Good area efficiency for FFT implementation")
-    report.append("")
+            yield f"- **{meta['display']}**: {cells} cells for {meta['area']}"
+    
+    yield "- **Overall**: Good area efficiency for FFT implementation"
+    yield ""
     
     # Design Trade-offs
-    report.append("### **Design Trade-offs**")
-    report.append("- **Performance**: High-throughput FFT computation with pipeline")
-    report.append("- **Area**: Optimized for ASIC implementation")
-    report.append("- **Power**: Pipeline design for power efficiency")
-    report.append("- **Flexibility**: Configurable FFT size and scaling")
-    report.append("- **Memory**: Efficient memory usage with twiddle factor ROM")
-    report.append("")
+    yield "### **Design Trade-offs**"
+    yield _TRADEOFFS_MD.format(performance="High-throughput FFT computation with pipeline")
+    yield ""
     
     # Technology Considerations
-    report.append("## 🔧 Technology Considerations")
-    report.append("")
-    report.append("### **Standard Cell Mapping**")
-    report.append("FFT IP maps to standard cell library:")
-    report.append("- **Combinational**: AND, OR, XOR, MUX, NAND, NOR, NOT gates")
-    report.append("- **Sequential**: DFF, DFFE flip-flops")
-    report.append("- **Arithmetic**: Custom arithmetic units for butterfly operations")
-    report.append("- **Memory**: ROM macros for twiddle factors")
-    report.append("- **Compatibility**: Compatible with most CMOS processes")
-    report.append("")
+    yield "## 🔧 Technology Considerations"
+    yield ""
+    yield "### **Standard Cell Mapping**"
+    yield "FFT IP maps to standard cell library:"
+    yield "- **Combinational**: AND, OR, XOR, MUX, NAND, NOR, NOT gates"
+    yield "- **Sequential**: DFF, DFFE flip-flops"
+    yield "- **Arithmetic**: Custom arithmetic units for butterfly operations"
+    yield "- **Memory**: ROM macros for twiddle factors"
+    yield "- **Compatibility**: Compatible with most CMOS processes"
+    yield ""
     
     # Power Considerations
-    report.append("### **Power Considerations**")
-    report.append("- **Static Power**: Moderate (sequential elements)")
-    report.append("- **Dynamic Power**: High (arithmetic operations, memory access)")
-    report.append("- **Clock Power**: Multiple clock domains")
-    report.append("- **Memory Power**: ROM/RAM access patterns")
-    report.append("")
+    yield "### **Power Considerations**"
+    yield _POWER_MD.format(dynamic="High (arithmetic operations, memory access)")
+    yield ""
     
     # FFT-Specific Considerations
-    report.append("### **FFT-Specific Considerations**")
-    report.append("- **Butterfly Operations**: Complex arithmetic dominates area")
-    report.append("- **Pipeline Efficiency**: Multi-stage pipeline for throughput")
-    report.append("- **Memory Bandwidth**: Twiddle factor and data memory access")
-    report.append("- **Scaling Logic**: Overflow prevention and scaling control")
-    report.append("- **Control Logic**: FSM for FFT stage management")
-    report.append("")
+    yield "### **FFT-Specific Considerations**"
+    yield _FFT_MD
+    yield ""
     
     # Synthesis Quality Metrics
-    report.append("## 📈 Synthesis Quality Metrics")
-    report.append("")
-    report.append("### **Module Synthesis Status**")
-    report.append("| Module | Status | Synthesis Time | Quality |")
-    report.append("|--------|--------|----------------|---------|")
-    
-    for display_name in modules.values():
-        if display_name in module_stats:
-            if 'FFT Engine' in display_name or 'FFT Control' in display_name or 'Rescale Unit' in display_name or 'Scale Factor' in display_name:
-                report.append(f"| {display_name} | ✅ PASS | ~30s | Excellent |")
-            elif 'Twiddle ROM' in display_name:
-                report.append(f"| {display_name} | ✅ PASS | ~60s | Good |")
-            elif 'Memory Interface' in display_name:
-                report.append(f"| {display_name} | ⚠️ PARTIAL | ~30s | Simplified |")
-        else:
-            if 'FFT Engine' in display_name or 'FFT Control' in display_name or 'Rescale Unit' in display_name or 'Scale Factor' in display_name:
-                report.append(f"| {display_name} | ✅ PASS | ~30s | Excellent |")
-            elif 'Twiddle ROM' in display_name:
-                report.append(f"| {display_name} | ✅ PASS | ~60s | Good |")
-            elif 'Memory Interface' in display_name:
-                report.append(f"| {display_name} | ⚠️ PARTIAL | ~30s | Simplified |")
-    
-    report.append("")
-    report.append("### **Quality Indicators**")
-    report.append("- **✅ All core modules synthesize successfully**")
-    report.append("- **✅ No timing violations detected**")
-    report.append("- **✅ Clean logic synthesis**")
-    report.append("- **⚠️ Memory interface needs optimization**")
-    report.append("- **✅ Ready for production with improvements**")
-    report.append("")
+    yield "## 📈 Synthesis Quality Metrics"
+    yield ""
+    yield "### **Module Synthesis Status**"
+    yield "| Module | Status | Synthesis Time | Quality |"
+    yield "|--------|--------|----------------|---------|"
+    
+    for meta in _MODULE_META.values():
+        status, synth_time, quality = meta['quality']
+        yield f"| {meta['display']} | {status} | {synth_time} | {quality} |"
+    
+    yield ""
+    yield "### **Quality Indicators**"
+    yield "- **✅ All core modules synthesize successfully**"
+    yield "- **✅ No timing violations detected**"
+    yield "- **✅ Clean logic synthesis**"
+    yield "- **⚠️ Memory interface needs optimization**"
+    yield "- **✅ Ready for production with improvements**"
+    yield ""
     
     # Recommendations
-    report.append("## 🎯 Recommendations for Production")
-    report.append("")
-    report.append("### **1. Memory Interface Optimization**")
-    report.append("- **Option A**: Use external memory controller for large memory arrays")
-    report.append("- **Option B**: Implement memory interface with configurable memory size")
-    report.append("- **Option C**: Use memory generator for synthesis (e.g., Xilinx BRAM, Intel M20K)")
-    report.append("")
-    report.append("### **2. Synthesis Flow Improvements**")
-    report.append("- Implement incremental synthesis for faster iterations")
-    report.append("- Add synthesis constraints for timing optimization")
-    report.append("- Use vendor-specific synthesis tools for production")
-    report.append("- Add power analysis with actual switching activity")
-    report.append("")
-    report.append("### **3. Verification Strategy**")
-    report.append("- Create synthesis regression tests")
-    report.append("- Implement automated synthesis checking")
-    report.append("- Add synthesis timing analysis")
-    report.append("- Perform power analysis with realistic workloads")
-    report.append("")
+    yield "## 🎯 Recommendations for Production"
+    yield ""
+    yield "### **1. Memory Interface Optimization**"
+    yield "- **Option A**: Use external memory controller for large memory arrays"
+    yield "- **Option B**: Implement memory interface with configurable memory size"
+    yield "- **Option C**: Use memory generator for synthesis (e.g., Xilinx BRAM, Intel M20K)"
+    yield ""
+    yield "### **2. Synthesis Flow Improvements**"
+    yield "- Implement incremental synthesis for faster iterations"
+    yield "- Add synthesis constraints for timing optimization"
+    yield "- Use vendor-specific synthesis tools for production"
+    yield "- Add power analysis with actual switching activity"
+    yield ""
+    yield "### **3. Verification Strategy**"
+    yield "- Create synthesis regression tests"
+    yield "- Implement automated synthesis checking"
+    yield "- Add synthesis timing analysis"
+    yield "- Perform power analysis with realistic workloads"
+    yield ""
     
     # Conclusion
-    report.append("## 🏆 Conclusion")
-    report.append("")
-    report.append("The FFT IP demonstrates excellent synthesis quality with:")
-    report.append("- **Solid core logic**: All main modules synthesize successfully")
-    report.append("- **Good area efficiency**: Reasonable gate counts for functionality")
-    report.append("- **Production ready**: Core FFT logic is ready for ASIC/FPGA implementation")
-    report.append("- **Memory optimization needed**: Large memory array requires optimization")
-    report.append("")
-    report.append("**Next Steps**:")
-    report.append("1. Implement optimized memory interface")
-    report.append("2. Add synthesis constraints and timing analysis")
-    report.append("3. Create automated synthesis regression tests")
-    report.append("4. Optimize for target FPGA/ASIC technology")
-    report.append("5. Perform power analysis with realistic workloads")
-    report.append("")
-    report.append("The IP is well-structured and synthesis-friendly, with the main issue being the large memory array in the memory interface. The core FFT logic is solid and ready for production use.")
-    
-    return "\n".join(report)
+    yield "## 🏆 Conclusion"
+    yield ""
+    yield "The FFT IP demonstrates excellent synthesis quality with:"
+    yield "- **Solid core logic**: All main modules synthesize successfully"
+    yield "- **Good area efficiency**: Reasonable gate counts for functionality"
+    yield "- **Production ready**: Core FFT logic is ready for ASIC/FPGA implementation"
+    yield "- **Memory optimization needed**: Large memory array requires optimization"
+    yield ""
+    yield "**Next Steps**:"
+    yield "1. Implement optimized memory interface"
+    yield "2. Add synthesis constraints and timing analysis"
+    yield "3. Create automated synthesis regression tests"
+    yield "4. Optimize for target FPGA/ASIC technology"
+    yield "5. Perform power analysis with realistic workloads"
+    yield ""
+    yield "The IP is well-structured and synthesis-friendly, with the main issue being the large memory array in the memory interface. The core FFT logic is solid and ready for production use."
+    
 
-def generate_gate_report():
-    """Generate comprehensive gate analysis report."""
+def generate_comprehensive_gate_report(synthesis_dir: str = "../synthesis", output_file: str = "gate_analysis_report.md") -> str:
+    """Generate comprehensive gate analysis report from synthesis statistics."""
+    return "\n".join(_iter_comprehensive_gate_report(synthesis_dir))
+
+def _iter_gate_report() -> Iterator[str]:
+    """Yield the netlist gate analysis report line by line."""
     netlists = {
         'FFT Top': 'fft_top_synth_generic.v'
     }
@@ -488,22 +483,22 @@ def generate_gate_report():
     for impl_name, netlist_file in netlists.items():
         # Check if netlist exists in synthesis/netlists directory
         netlist_path = f"../synthesis/netlists/{netlist_file}"
-        if Path(netlist_path).exists():
-            results[impl_name] = analyze_gates(netlist_path)
+        result = analyze_gates(netlist_path)
+        if result is not None:
+            results[impl_name] = result
     
     # Generate report
-    report = []
-    report.append("# Fast Fourier Transform IP Gate-Level Analysis Report")
-    report.append("=" * 65)
-    report.append("")
-    report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append("")
+    yield "# Fast Fourier Transform IP Gate-Level Analysis Report"
+    yield "=" * 65
+    yield ""
+    yield f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    yield ""
     
     # Summary table
-    report.append("## Gate Count Summary")
-    report.append("")
-    report.append("| Implementation | Primitive Gates | Transistors | Design Style |")
-    report.append("|----------------|-----------------|-------------|--------------|")
+    yield "## Gate Count Summary"
+    yield ""
+    yield "| Implementation | Primitive Gates | Transistors | Design Style |"
+    yield "|----------------|-----------------|-------------|--------------|"
     
     for impl_name, result in results.items():
         if result:
@@ -511,146 +506,144 @@ def generate_gate_report():
             transistors = result['total_transistors']
             # Determine design style based on actual module instances
             actual_modules = {k: v for k, v in result['module_instances'].items() 
-                             if not k.startswith('_') and k not in ['\\$_AND_', '\\$_OR_', '\\$_XOR_', '\\$_XNOR_', '\\$_ANDNOT_']}
+                             if not k.startswith('_') and k not in _PRIMITIVE_EXCLUDE}
             style = "Hierarchical" if actual_modules else "Flat"
-            report.append(f"| {impl_name} | {gates} | {transistors} | {style} |")
+            yield f"| {impl_name} | {gates} | {transistors} | {style} |"
     
-    report.append("")
+    yield ""
     
     # Detailed analysis for each implementation
     for impl_name, result in results.items():
         if not result:
             continue
             
-        report.append(f"## {impl_name} Implementation")
-        report.append("")
+        yield f"## {impl_name} Implementation"
+        yield ""
         
         # Gate breakdown
-        report.append("### Gate Breakdown")
-        report.append("")
+        yield "### Gate Breakdown"
+        yield ""
         if result['gate_counts']:
-            report.append("| Gate Type | Count | Transistors |")
-            report.append("|-----------|-------|-------------|")
+            yield "| Gate Type | Count | Transistors |"
+            yield "|-----------|-------|-------------|"
             for gate_type, count in sorted(result['gate_counts'].items()):
-                transistors = count * {
-                    'AND': 6, 'OR': 6, 'XOR': 8, 'XNOR': 8, 
-                    'ANDNOT': 4, 'NAND': 4, 'NOR': 4, 'NOT': 2,
-                    'MUX': 12, 'DFF': 20, 'DFFE': 24, 'LATCH': 12, 'ALDFFE': 28,
-                    'MUL': 200, 'ADD': 50, 'SUB': 50, 'ROM': 100, 'RAM': 150
-                }.get(gate_type, 6)
-                report.append(f"| {gate_type} | {count} | {transistors} |")
+                transistors = count * _TRANSISTOR_COST.get(gate_type, 6)
+                yield f"| {gate_type} | {count} | {transistors} |"
         else:
-            report.append("No primitive gates found.")
+            yield "No primitive gates found."
         
-        report.append("")
+        yield ""
         
         # Module instances
         if result['module_instances']:
-            report.append("### Module Instances")
-            report.append("")
-            report.append("| Module | Instances |")
-            report.append("|--------|-----------|")
+            yield "### Module Instances"
+            yield ""
+            yield "| Module | Instances |"
+            yield "|--------|-----------|"
             for module, count in result['module_instances'].items():
-                report.append(f"| {module} | {count} |")
-            report.append("")
+                yield f"| {module} | {count} |"
+            yield ""
         
         # Total statistics
-        report.append("### Total Statistics")
-        report.append("")
-        report.append(f"- **Primitive Gates**: {result['total_primitive_gates']}")
-        report.append(f"- **Estimated Transistors**: {result['total_transistors']}")
+        yield "### Total Statistics"
+        yield ""
+        yield f"- **Primitive Gates**: {result['total_primitive_gates']}"
+        yield f"- **Estimated Transistors**: {result['total_transistors']}"
         actual_modules = {k: v for k, v in result['module_instances'].items() 
-                         if not k.startswith('_') and k not in ['\\$_AND_', '\\$_OR_', '\\$_XOR_', '\\$_XNOR_', '\\$_ANDNOT_']}
-        report.append(f"- **Design Style**: {'Hierarchical' if actual_modules else 'Flat'}")
-        report.append("")
+                         if not k.startswith('_') and k not in _PRIMITIVE_EXCLUDE}
+        yield f"- **Design Style**: {'Hierarchical' if actual_modules else 'Flat'}"
+        yield ""
         
         # Logic complexity analysis
-        report.append("### Logic Complexity Analysis")
-        report.append("")
+        yield "### Logic Complexity Analysis"
+        yield ""
         
         # Analyze FFT-specific characteristics
         dff_count = result['gate_counts'].get('DFF', 0) + result['gate_counts'].get('DFFE', 0)
         combinational_gates = sum(count for gate, count in result['gate_counts'].items() 
-                                 if gate not in ['DFF', 'DFFE', 'LATCH', 'ALDFFE'])
+                                 if gate not in _SEQUENTIAL_GATES)
         arithmetic_units = (result['gate_counts'].get('MUL', 0) + 
                            result['gate_counts'].get('ADD', 0) + 
                            result['gate_counts'].get('SUB', 0))
         memory_units = result['gate_counts'].get('ROM', 0) + result['gate_counts'].get('RAM', 0)
         
-        report.append(f"- **Sequential Elements**: {dff_count} flip-flops")
-        report.append(f"- **Combinational Logic**: {combinational_gates} gates")
-        report.append(f"- **Arithmetic Units**: {arithmetic_units} (MUL/ADD/SUB)")
-        report.append(f"- **Memory Units**: {memory_units} (ROM/RAM)")
-        report.append(f"- **Sequential/Combinational Ratio**: {dff_count/(combinational_gates+1):.2f}")
+        yield f"- **Sequential Elements**: {dff_count} flip-flops"
+        yield f"- **Combinational Logic**: {combinational_gates} gates"
+        yield f"- **Arithmetic Units**: {arithmetic_units} (MUL/ADD/SUB)"
+        yield f"- **Memory Units**: {memory_units} (ROM/RAM)"
+        yield f"- **Sequential/Combinational Ratio**: {dff_count/(combinational_gates+1):.2f}"
         
         # FFT-specific analysis
-        report.append("- **FFT Algorithm**: Radix-2 Decimation-in-Time (DIT)")
-        report.append("- **Pipeline Stages**: Multi-stage pipeline for high throughput")
-        report.append("- **Butterfly Operations**: Complex arithmetic for FFT computation")
-        report.append("- **Twiddle Factor ROM**: Pre-computed twiddle factors")
-        report.append("- **Memory Interface**: APB slave interface for data transfer")
-        report.append("- **Scaling Control**: Dynamic scaling for overflow prevention")
+        yield "- **FFT Algorithm**: Radix-2 Decimation-in-Time (DIT)"
+        yield "- **Pipeline Stages**: Multi-stage pipeline for high throughput"
+        yield "- **Butterfly Operations**: Complex arithmetic for FFT computation"
+        yield "- **Twiddle Factor ROM**: Pre-computed twiddle factors"
+        yield "- **Memory Interface**: APB slave interface for data transfer"
+        yield "- **Scaling Control**: Dynamic scaling for overflow prevention"
         
-        report.append("")
+        yield ""
     
     # Performance comparison
-    report.append("## Performance Analysis")
-    report.append("")
-    report.append("### Area Efficiency")
-    report.append("")
+    yield "## Performance Analysis"
+    yield ""
+    yield "### Area Efficiency"
+    yield ""
     if results:
         result = list(results.values())[0]
         if result:
             gates = result['total_primitive_gates']
             transistors = result['total_transistors']
-            report.append(f"- **Gate Count**: {gates} primitive gates")
-            report.append(f"- **Transistor Count**: {transistors} transistors")
-            report.append(f"- **Area Estimate**: ~{transistors/1000:.1f}K transistors")
-    
-    report.append("")
-    report.append("### Design Trade-offs")
-    report.append("")
-    report.append("- **Performance**: High-throughput FFT computation")
-    report.append("- **Area**: Optimized for ASIC implementation")
-    report.append("- **Power**: Pipeline design for power efficiency")
-    report.append("- **Flexibility**: Configurable FFT size and scaling")
-    report.append("- **Memory**: Efficient memory usage with twiddle factor ROM")
-    report.append("")
+            yield f"- **Gate Count**: {gates} primitive gates"
+            yield f"- **Transistor Count**: {transistors} transistors"
+            yield f"- **Area Estimate**: ~{transistors/1000:.1f}K transistors"
+    
+    yield ""
+    yield "### Design Trade-offs"
+    yield ""
+    yield _TRADEOFFS_MD.format(performance="High-throughput FFT computation")
+    yield ""
     
     # Technology considerations
-    report.append("## Technology Considerations")
-    report.append("")
-    report.append("### Standard Cell Mapping")
-    report.append("")
-    report.append("FFT IP maps to standard cell library:")
-    report.append("- Combinational gates (AND, OR, XOR, MUX)")
-    report.append("- Sequential elements (DFF, DFFE)")
-    report.append("- Arithmetic units (MUL, ADD, SUB)")
-    report.append("- Memory macros (ROM, RAM)")
-    report.append("- Compatible with most CMOS processes")
-    report.append("")
-    
-    report.append("### Power Considerations")
-    report.append("")
-    report.append("- **Static Power**: Moderate (sequential elements)")
-    report.append("- **Dynamic Power**: High (arithmetic operations)")
-    report.append("- **Clock Power**: Multiple clock domains")
-    report.append("- **Memory Power**: ROM/RAM access patterns")
-    report.append("")
+    yield "## Technology Considerations"
+    yield ""
+    yield "### Standard Cell Mapping"
+    yield ""
+    yield "FFT IP maps to standard cell library:"
+    yield "- Combinational gates (AND, OR, XOR, MUX)"
+    yield "- Sequential elements (DFF, DFFE)"
+    yield "- Arithmetic units (MUL, ADD, SUB)"
+    yield "- Memory macros (ROM, RAM)"
+    yield "- Compatible with most CMOS processes"
+    yield ""
+    
+    yield "### Power Considerations"
+    yield ""
+    yield _POWER_MD.format(dynamic="High (arithmetic operations)")
+    yield ""
     
     # FFT-specific considerations
-    report.append("### FFT-Specific Considerations")
-    report.append("")
-    report.append("- **Butterfly Operations**: Complex arithmetic dominates area")
-    report.append("- **Pipeline Efficiency**: Multi-stage pipeline for throughput")
-    report.append("- **Memory Bandwidth**: Twiddle factor and data memory access")
-    report.append("- **Scaling Logic**: Overflow prevention and scaling control")
-    report.append("- **Control Logic**: FSM for FFT stage management")
-    report.append("")
-    
-    return "\n".join(report)
+    yield "### FFT-Specific Considerations"
+    yield ""
+    yield _FFT_MD
+    yield ""
+    
+
+def generate_gate_report() -> str:
+    """Generate comprehensive gate analysis report."""
+    return "\n".join(_iter_gate_report())
+
+def _write_file(path: str, data: bytes) -> None:
+    """Write data to path with unbuffered os.write calls (normally just one)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
 
-def main():
+def main() -> None:
     """Main function with command line argument parsing."""
     parser = argparse.ArgumentParser(description='Generate gate analysis report for FFT IP')
     parser.add_argument('--synthesis-dir', default='../synthesis', 
@@ -666,18 +659,22 @@ def main():
     
     if args.comprehensive:
         # Generate comprehensive report from synthesis statistics
-        report = generate_comprehensive_gate_report(args.synthesis_dir, args.output)
+        report_lines = _iter_comprehensive_gate_report(args.synthesis_dir)
     else:
         # Generate legacy report from netlists
-        report = generate_gate_report()
+        report_lines = _iter_gate_report()
     
-    # Write to file
-    with open(args.output, "w") as f:
-        f.write(report)
+    # Assemble the report in memory and write it with a single syscall
+    buffer = io.StringIO()
+    for line in report_lines:
+        buffer.write(line)
+        buffer.write("\n")
+    report = buffer.getvalue()
+    _write_file(args.output, report.encode('utf-8'))
     
     print(f"Gate analysis report generated: {args.output}")
     print("\n" + "="*65)
-    print(report)
+    sys.stdout.write(report)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -75,7 +75,8 @@ def run_memory_analysis(project_root: str = ".", output_dir: str = "reports") ->
             # Run memory analysis
             cmd = [
                 sys.executable, str(memory_analysis_script),
-                "--output-dir", str(output_dir)
+                "--output-dir", str(output_dir),
+                "--quiet"
             ]
             
             result = subprocess.run(cmd, capture_output=True, text=True, cwd=project_root)
@@ -6,221 +6,320 @@ This script analyzes memory usage and synthesis results to generate detailed rep
 showing current memory requirements, gate counts, and synthesis performance.
 """
 
+from __future__ import annotations
+
 import os
+import re
 import sys
-import json
-import argparse
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any, List
+from functools import lru_cache
+from dataclasses import dataclass, field
+
+# "<label>: value" fields extracted from synthesis and gate analysis reports
+_STATS_RE = re.compile(r"(Number of cells|Number of memory bits|Total Gate Count):([^:\n]*)")
+
+# Static report body; the {placeholders} are filled per run
+_REPORT_TEMPLATE = """\
+# FFT IP Memory Usage Analysis Report
+========================================
+
+**Generated:** {generated}
+**Project:** {project}
+
+## 🎯 Memory Usage Summary
+
+### Memory Interface Analysis
+
+{memory_interface_block}
+**Current Memory Requirements:**
+- **Memory Size:** 2048×32-bit (64KB)
+- **Address Bits:** 11-bit
+- **Expected Cell Count:** ~100-500 cells
+
+### Twiddle ROM Analysis
+
+{twiddle_rom_block}
+**Current Memory Requirements:**
+- **ROM Size:** 1024×16-bit (16KB)
+- **Address Bits:** 10-bit
+- **Expected Cell Count:** ~50-200 cells
+
+### Overall Design Analysis
+
+{overall_block}**Expected Overall Results:**
+- **Total Memory:** ~80KB (64KB + 16KB)
+- **Expected Total Cells:** ~150-700 cells
+- **Memory Efficiency:** Optimized for ASIC/FPGA implementation
+
+## 🔧 Current Implementation Details
+
+### 1. Memory Interface
+- **Memory Size:** Reduced from 65536×32-bit to 2048×32-bit
+- **Synthesis Attributes:** Added ram_style = block
+- **Address Optimization:** Changed from 16-bit to 11-bit addressing
+- **Timing Improvements:** Added registered outputs and pipelined ready signal
+
+### 2. Twiddle ROM
+- **ROM Size:** Reduced from 16K bits to 4K bits using symmetry
+- **Synthesis Attributes:** Added rom_style = block
+- **Symmetry Implementation:** Using trigonometric identities
+- **Data Width:** Changed from 32-bit to 16-bit storage
+
+## 🧪 Test Results
+
+**Memory Interface Tests:** ✅ PASSED
+**Twiddle ROM Tests:** ✅ PASSED
+**Synthesis Verification:** ✅ PASSED
+**All Core Modules:** ✅ Synthesize successfully
+
+## 🎯 Recommendations
+
+### For Production Use:
+1. **Memory Interface:** Use external memory controller for large arrays
+2. **Synthesis Flow:** Implement incremental synthesis for faster iterations
+3. **Timing Analysis:** Add synthesis constraints for optimization
+4. **Power Analysis:** Perform power analysis with realistic workloads
+
+### Next Steps:
+1. **Verify on Ubuntu:** Run complete test suite to confirm improvements
+2. **Synthesis Regression:** Create automated synthesis checking
+3. **Performance Validation:** Test with real FFT workloads
+4. **Documentation Update:** Update design specs with new metrics
+
+## 🏆 Conclusion
+
+The FFT IP demonstrates efficient memory usage:
+- **Core Logic:** All modules synthesize successfully
+- **Memory Efficiency:** Optimized memory sizing for FFT operations
+- **Production Ready:** Ready for ASIC/FPGA implementation
+- **Performance:** Maintained functionality with efficient area usage
+
+The IP is ready for production use with the current memory implementation.
+"""
+
+@dataclass(slots=True)
+class MemStats:
+    """Synthesis stats for one memory block; None when not reported."""
+    cell_count: str | None = None
+    memory_bits: str | None = None
+
+@dataclass(slots=True)
+class MemoryAnalysisResults:
+    """Metrics collected by analyze_memory_usage_results."""
+    memory_interface: MemStats = field(default_factory=MemStats)
+    twiddle_rom: MemStats = field(default_factory=MemStats)
+    total_gates: str | None = None
+    test_status: str = "unknown"
+
+# (label, key) pairs reported for each synthesized block
+_MEMORY_INTERFACE_FIELDS = (("Cell Count", "cell_count"), ("Memory Bits", "memory_bits"))
+_TWIDDLE_ROM_FIELDS = (("Cell Count", "cell_count"),)
+
+@lru_cache(maxsize=64)
+def _parse_stats_cached(path: str, mtime_ns: int, size: int, keys: tuple[str, ...]) -> dict[str, str]:
+    """Parse a report file; mtime and size only key the cache."""
+    found = {}
+    for match in _STATS_RE.finditer(Path(path).read_text()):
+        key = match.group(1)
+        if key in keys and key not in found:
+            found[key] = match.group(2).strip()
+    return found
+
+def _parse_stats(path: Path, keys: tuple[str, ...]) -> dict[str, str]:
+    """Return the value of the first "<key>: value" line per key, cached until the file changes."""
+    st = path.stat()
+    return _parse_stats_cached(str(path), st.st_mtime_ns, st.st_size, keys)
 
-def analyze_memory_usage_results(project_root: str = ".") -> Dict[str, Any]:
+def _extract(path: Path, fields: tuple[tuple[str, str], ...], description: str) -> dict[str, str]:
+    """Extract (label, key) fields from a report, warning instead of failing on errors."""
+    try:
+        stats = _parse_stats(path, tuple(label for label, _ in fields))
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Warning: Could not parse {description}: {e}")
+        return {}
+    return {key: stats[label] for label, key in fields if label in stats}
+
+def _report_inputs(project_root: str) -> tuple[Path, Path, Path]:
+    """Return the memory interface, twiddle ROM and gate analysis report paths."""
+    flow_dir = Path(project_root) / "flow"
+    reports_dir = flow_dir / "synthesis" / "reports"
+    return (reports_dir / "memory_interface_stats.txt",
+            reports_dir / "twiddle_rom_stats.txt",
+            flow_dir / "yosys" / "gate_analysis_report.md")
+
+def _inputs_key(project_root: str) -> str:
+    """Hash the project path and the (mtime, size) of every report input."""
+    import hashlib
+    state: list[object] = [os.path.abspath(project_root)]
+    for path in _report_inputs(project_root):
+        try:
+            st = path.stat()
+            state.append((str(path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            state.append((str(path), None))
+    return hashlib.sha256(repr(state).encode("utf-8")).hexdigest()
+
+def analyze_memory_usage_results(project_root: str = ".") -> MemoryAnalysisResults:
     """Analyze memory usage and synthesis results to return metrics."""
     
-    results = {
-        "memory_interface": {},
-        "twiddle_rom": {},
-        "overall_improvement": {},
-        "test_status": "unknown"
-    }
+    results = MemoryAnalysisResults()
     
-    # Check for synthesis reports
-    synthesis_dir = Path(project_root) / "flow" / "synthesis"
-    yosys_dir = Path(project_root) / "flow" / "yosys"
+    # Check for synthesis reports (one directory scan instead of a stat per file)
+    memory_stats_file, twiddle_stats_file, gate_report_file = _report_inputs(project_root)
+    reports_dir = memory_stats_file.parent
+    try:
+        with os.scandir(reports_dir) as entries:
+            report_names = {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        report_names = set()
     
     # Analyze memory interface optimization
-    memory_stats_file = synthesis_dir / "reports" / "memory_interface_stats.txt"
-    if memory_stats_file.exists():
-        try:
-            with open(memory_stats_file, 'r') as f:
-                content = f.read()
-                
-            # Extract cell count
-            if "Number of cells:" in content:
-                lines = content.split('\n')
-                for line in lines:
-                    if "Number of cells:" in line:
-                        cell_count = line.split(":")[1].strip()
-                        results["memory_interface"]["cell_count"] = cell_count
-                        break
-                        
-            # Extract memory usage
-            if "Number of memory bits:" in content:
-                for line in lines:
-                    if "Number of memory bits:" in line:
-                        memory_bits = line.split(":")[1].strip()
-                        results["memory_interface"]["memory_bits"] = memory_bits
-                        break
-                        
-        except Exception as e:
-            print(f"Warning: Could not parse memory interface stats: {e}")
+    if memory_stats_file.name in report_names:
+        results.memory_interface = MemStats(**_extract(
+            memory_stats_file,
+            (("Number of cells", "cell_count"), ("Number of memory bits", "memory_bits")),
+            "memory interface stats"))
     
     # Analyze twiddle ROM optimization
-    twiddle_stats_file = synthesis_dir / "reports" / "twiddle_rom_stats.txt"
-    if twiddle_stats_file.exists():
-        try:
-            with open(twiddle_stats_file, 'r') as f:
-                content = f.read()
-                
-            # Extract cell count
-            if "Number of cells:" in content:
-                lines = content.split('\n')
-                for line in lines:
-                    if "Number of cells:" in line:
-                        cell_count = line.split(":")[1].strip()
-                        results["twiddle_rom"]["cell_count"] = cell_count
-                        break
-                        
-        except Exception as e:
-            print(f"Warning: Could not parse twiddle ROM stats: {e}")
+    if twiddle_stats_file.name in report_names:
+        results.twiddle_rom = MemStats(**_extract(
+            twiddle_stats_file,
+            (("Number of cells", "cell_count"),),
+            "twiddle ROM stats"))
     
     # Check for gate analysis report
-    gate_report_file = yosys_dir / "gate_analysis_report.md"
     if gate_report_file.exists():
-        try:
-            with open(gate_report_file, 'r') as f:
-                content = f.read()
-                
-            # Extract total gate count
-            if "Total Gate Count:" in content:
-                lines = content.split('\n')
-                for line in lines:
-                    if "Total Gate Count:" in line:
-                        gate_count = line.split(":")[1].strip()
-                        results["overall_improvement"]["total_gates"] = gate_count
-                        break
-                        
-        except Exception as e:
-            print(f"Warning: Could not parse gate analysis report: {e}")
+        results.total_gates = _extract(
+            gate_report_file,
+            (("Total Gate Count", "total_gates"),),
+            "gate analysis report").get("total_gates")
     
     return results
 
-def generate_memory_analysis_report(project_root: str = ".", output_dir: str = "reports") -> str:
-    """Generate a comprehensive memory usage analysis report."""
+def _results_block(stats: MemStats, fields: tuple[tuple[str, str], ...]) -> str:
+    """Render the "Current Results" block for one synthesized block."""
+    lines = [f"- **{label}:** {value}\n" for label, key in fields
+             if (value := getattr(stats, key)) is not None]
+    if not lines:
+        return "**Status:** No synthesis data available\n"
+    return "**Current Results:**\n" + "".join(lines)
+
+def generate_memory_analysis_report(project_root: str = ".", output_dir: str = "reports",
+                                    verbose: bool = True,
+                                    report_name: str = "memory_analysis_report.md",
+                                    force: bool = False,
+                                    results: MemoryAnalysisResults | None = None) -> str:
+    """Generate a comprehensive memory usage analysis report.
+    
+    Pass results to reuse metrics the caller already collected.
+    """
     
-    print("🔍 Starting memory usage analysis...")
-    print(f"📁 Project root: {project_root}")
-    print(f"📁 Output directory: {output_dir}")
+    from datetime import datetime
+    
+    generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    project_name = os.path.basename(os.path.abspath(project_root))
+    
+    if verbose:
+        print("🔍 Starting memory usage analysis...")
+        print(f"📁 Project root: {project_root}")
+        print(f"📁 Output directory: {output_dir}")
     
     # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    report_path = out / report_name
+    
+    # Skip regeneration when none of the inputs changed since the last run
+    stamp_path = out / f".{report_name}.stamp"
+    key = _inputs_key(project_root)
+    if not force and report_path.exists():
+        try:
+            if stamp_path.read_text() == key:
+                if verbose:
+                    print(f"✅ Memory analysis report up to date: {report_path}")
+                return str(report_path)
+        except OSError:
+            pass
     
     # Analyze results
-    results = analyze_memory_usage_results(project_root)
-    
-    # Generate report
-    report_path = Path(output_dir) / "memory_analysis_report.md"
-    
-    with open(report_path, 'w') as f:
-        f.write("# FFT IP Memory Usage Analysis Report\n")
-        f.write("=" * 40 + "\n\n")
-        f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"**Project:** {Path(project_root).name}\n\n")
-        
-        f.write("## 🎯 Memory Usage Summary\n\n")
-        
-        # Memory Interface Analysis
-        f.write("### Memory Interface Analysis\n\n")
-        if results["memory_interface"]:
-            f.write("**Current Results:**\n")
-            if "cell_count" in results["memory_interface"]:
-                f.write(f"- **Cell Count:** {results['memory_interface']['cell_count']}\n")
-            if "memory_bits" in results["memory_interface"]:
-                f.write(f"- **Memory Bits:** {results['memory_interface']['memory_bits']}\n")
-        else:
-            f.write("**Status:** No synthesis data available\n")
-        
-        f.write("\n**Current Memory Requirements:**\n")
-        f.write("- **Memory Size:** 2048×32-bit (64KB)\n")
-        f.write("- **Address Bits:** 11-bit\n")
-        f.write("- **Expected Cell Count:** ~100-500 cells\n\n")
-        
-        # Twiddle ROM Analysis
-        f.write("### Twiddle ROM Analysis\n\n")
-        if results["twiddle_rom"]:
-            f.write("**Current Results:**\n")
-            if "cell_count" in results["twiddle_rom"]:
-                f.write(f"- **Cell Count:** {results['twiddle_rom']['cell_count']}\n")
-        else:
-            f.write("**Status:** No synthesis data available\n")
-        
-        f.write("\n**Current Memory Requirements:**\n")
-        f.write("- **ROM Size:** 1024×16-bit (16KB)\n")
-        f.write("- **Address Bits:** 10-bit\n")
-        f.write("- **Expected Cell Count:** ~50-200 cells\n\n")
-        
-        # Overall Design Analysis
-        f.write("### Overall Design Analysis\n\n")
-        if results["overall_improvement"]:
-            if "total_gates" in results["overall_improvement"]:
-                f.write(f"**Total Gate Count:** {results['overall_improvement']['total_gates']}\n\n")
-        else:
-            f.write("**Status:** Overall gate count not available\n\n")
-        
-        f.write("**Expected Overall Results:**\n")
-        f.write("- **Total Memory:** ~80KB (64KB + 16KB)\n")
-        f.write("- **Expected Total Cells:** ~150-700 cells\n")
-        f.write("- **Memory Efficiency:** Optimized for ASIC/FPGA implementation\n\n")
-        
-        # Current Implementation
-        f.write("## 🔧 Current Implementation Details\n\n")
-        f.write("### 1. Memory Interface\n")
-        f.write("- **Memory Size:** Reduced from 65536×32-bit to 2048×32-bit\n")
-        f.write("- **Synthesis Attributes:** Added ram_style = block\n")
-        f.write("- **Address Optimization:** Changed from 16-bit to 11-bit addressing\n")
-        f.write("- **Timing Improvements:** Added registered outputs and pipelined ready signal\n\n")
-        
-        f.write("### 2. Twiddle ROM\n")
-        f.write("- **ROM Size:** Reduced from 16K bits to 4K bits using symmetry\n")
-        f.write("- **Synthesis Attributes:** Added rom_style = block\n")
-        f.write("- **Symmetry Implementation:** Using trigonometric identities\n")
-        f.write("- **Data Width:** Changed from 32-bit to 16-bit storage\n\n")
-        
-        # Test Results
-        f.write("## 🧪 Test Results\n\n")
-        f.write("**Memory Interface Tests:** ✅ PASSED\n")
-        f.write("**Twiddle ROM Tests:** ✅ PASSED\n")
-        f.write("**Synthesis Verification:** ✅ PASSED\n")
-        f.write("**All Core Modules:** ✅ Synthesize successfully\n\n")
-        
-        # Recommendations
-        f.write("## 🎯 Recommendations\n\n")
-        f.write("### For Production Use:\n")
-        f.write("1. **Memory Interface:** Use external memory controller for large arrays\n")
-        f.write("2. **Synthesis Flow:** Implement incremental synthesis for faster iterations\n")
-        f.write("3. **Timing Analysis:** Add synthesis constraints for optimization\n")
-        f.write("4. **Power Analysis:** Perform power analysis with realistic workloads\n\n")
-        
-        f.write("### Next Steps:\n")
-        f.write("1. **Verify on Ubuntu:** Run complete test suite to confirm improvements\n")
-        f.write("2. **Synthesis Regression:** Create automated synthesis checking\n")
-        f.write("3. **Performance Validation:** Test with real FFT workloads\n")
-        f.write("4. **Documentation Update:** Update design specs with new metrics\n\n")
-        
-        # Conclusion
-        f.write("## 🏆 Conclusion\n\n")
-        f.write("The FFT IP demonstrates efficient memory usage:\n")
-        f.write("- **Core Logic:** All modules synthesize successfully\n")
-        f.write("- **Memory Efficiency:** Optimized memory sizing for FFT operations\n")
-        f.write("- **Production Ready:** Ready for ASIC/FPGA implementation\n")
-        f.write("- **Performance:** Maintained functionality with efficient area usage\n\n")
-        
-        f.write("The IP is ready for production use with the current memory implementation.\n")
-    
-    print(f"✅ Memory analysis report generated: {report_path}")
+    if results is None:
+        results = analyze_memory_usage_results(project_root)
+    
+    # Overall Design Analysis
+    if results.total_gates is not None:
+        overall_block = f"**Total Gate Count:** {results.total_gates}\n\n"
+    else:
+        overall_block = "**Status:** Overall gate count not available\n\n"
+    
+    report = _REPORT_TEMPLATE.format(
+        generated=generated,
+        project=project_name,
+        memory_interface_block=_results_block(results.memory_interface, _MEMORY_INTERFACE_FIELDS),
+        twiddle_rom_block=_results_block(results.twiddle_rom, _TWIDDLE_ROM_FIELDS),
+        overall_block=overall_block,
+    )
+    report_path.write_bytes(report.encode("utf-8"))
+    stamp_path.write_bytes(key.encode("ascii"))
+    
+    if verbose:
+        print(f"✅ Memory analysis report generated: {report_path}")
     return str(report_path)
 
-def main():
-    """Main function for command-line usage."""
-    parser = argparse.ArgumentParser(description="Generate memory usage analysis report for FFT IP")
-    parser.add_argument("--project-root", default=".", help="Project root directory")
-    parser.add_argument("--output-dir", default="output_dir", help="Output directory for reports")
+def generate_memory_analysis_batch(project_roots: list[str], output_dir: str = "reports",
+                                   verbose: bool = True, force: bool = False) -> str:
+    """Generate one report per project root plus a summary.md comparing them."""
+    rows = []
+    for i, project_root in enumerate(project_roots):
+        # Analyze once and share the results between the report and the summary row
+        results = analyze_memory_usage_results(project_root)
+        report_path = generate_memory_analysis_report(
+            project_root, output_dir, verbose, f"memory_analysis_report_{i}.md", force, results)
+        memory, twiddle = results.memory_interface, results.twiddle_rom
+        rows.append(f"| {project_root} | {memory.cell_count or '-'} | "
+                    f"{memory.memory_bits or '-'} | {twiddle.cell_count or '-'} | "
+                    f"{results.total_gates or '-'} | {os.path.basename(report_path)} |\n")
     
-    args = parser.parse_args()
+    summary_path = Path(output_dir) / "summary.md"
+    summary_path.write_bytes((
+        "# FFT IP Memory Usage Summary\n\n"
+        "| Project Root | Memory Interface Cells | Memory Bits | Twiddle ROM Cells "
+        "| Total Gate Count | Report |\n"
+        "|---|---|---|---|---|---|\n" + "".join(rows)).encode("utf-8"))
+    
+    if verbose:
+        print(f"✅ Memory analysis summary generated: {summary_path}")
+    return str(summary_path)
+
+_PARSER = None
+
+def _get_parser():
+    """Build the command-line parser on first use and reuse it afterwards."""
+    global _PARSER
+    if _PARSER is None:
+        import argparse
+        _PARSER = argparse.ArgumentParser(description="Generate memory usage analysis report for FFT IP")
+        _PARSER.add_argument("--project-root", action="append", default=[],
+                             help="Project root directory (repeat to compare several runs)")
+        _PARSER.add_argument("--output-dir", default="output_dir", help="Output directory for reports")
+        _PARSER.add_argument("--quiet", action="store_true", help="Only print errors")
+        _PARSER.add_argument("--force", action="store_true",
+                             help="Regenerate reports even if their inputs are unchanged")
+    return _PARSER
+
+def main(argv: list[str] | None = None):
+    """Main function for command-line usage."""
+    args = _get_parser().parse_args(argv)
     
     try:
-        report_path = generate_memory_analysis_report(args.project_root, args.output_dir)
-        print(f"🎉 Memory analysis report completed: {report_path}")
+        project_roots = args.project_root or ["."]
+        if len(project_roots) == 1:
+            report_path = generate_memory_analysis_report(project_roots[0], args.output_dir,
+                                                          verbose=not args.quiet, force=args.force)
+        else:
+            report_path = generate_memory_analysis_batch(project_roots, args.output_dir,
+                                                         verbose=not args.quiet, force=args.force)
+        if not args.quiet:
+            print(f"🎉 Memory analysis report completed: {report_path}")
         return 0
     except Exception as e:
         print(f"❌ Error generating memory analysis report: {e}")
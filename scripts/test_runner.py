@@ -15,12 +15,27 @@ License: Apache-2.0
 import os
 import sys
 import json
+import shutil
+import hashlib
+import tempfile
 import subprocess
 import argparse
 import time
+import asyncio
+import logging
+import logging.handlers
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional
 import re
+import string
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -33,16 +48,192 @@ class Colors:
     WHITE = '\033[1;37m'
     NC = '\033[0m'  # No Color
 
+# Markdown test report written by TestRunner.generate_report
+_REPORT_TEMPLATE = string.Template("""# FFT IP Memory Optimization Test Report
+
+## Test Summary
+- **Test Date**: $test_date
+- **Test Runner**: Python Test Runner
+- **Test Modules**: $test_modules
+
+## Expected Results
+- **Memory Interface**: < $memory_interface_cells cells (down from 67,754)
+- **Twiddle ROM**: > $twiddle_rom_cells cells (up from 85)
+- **Total Design**: < $total_cells cells (down from 74,217)
+
+## Test Results
+$test_results$failures
+## Optimization Summary
+- **Memory Interface**: Synthesis attributes applied (ram_style = 'block')
+- **Memory Size**: Corrected from 65536×32-bit to 2048×32-bit (64K bits)
+- **Address Width**: Optimized from 16-bit to 11-bit
+- **Twiddle ROM**: Symmetry optimization implemented (4x size reduction)
+- **ROM Size**: Reduced from 2048×32-bit to 1024×16-bit (4K bits)
+
+## Recommendations
+1. Verify synthesis reports for memory macro usage
+2. Check timing constraints for optimized design
+3. Validate functionality with comprehensive simulation
+4. Compare gate count with previous baseline
+
+## Next Steps
+1. Run physical synthesis with vendor tools
+2. Implement memory generators for production
+3. Add advanced symmetry optimizations
+4. Optimize for specific target technology
+""")
+
+# Log level for "[SUCCESS]" status lines, between INFO and WARNING
+SUCCESS = 25
+logging.addLevelName(SUCCESS, "SUCCESS")
+_STATUS_LEVELS = {
+    "INFO": logging.INFO,
+    "SUCCESS": SUCCESS,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR
+}
+
+_COLOR_MAP = {
+    logging.INFO: Colors.BLUE,
+    SUCCESS: Colors.GREEN,
+    logging.WARNING: Colors.YELLOW,
+    logging.ERROR: Colors.RED
+}
+
+class _StatusFormatter(logging.Formatter):
+    """Format log records as colored "[STATUS] message" lines"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        color = _COLOR_MAP.get(record.levelno, Colors.WHITE)
+        return f"{color}[{record.levelname}]{Colors.NC} {record.getMessage()}"
+
+# Status output is buffered and written to stdout in batches: at the end of
+# each test phase, on any error, or when the buffer fills
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(_StatusFormatter())
+_log_buffer = logging.handlers.MemoryHandler(1024, flushLevel=logging.ERROR,
+                                             target=_stdout_handler)
+_LOG = logging.getLogger("fft_runner")
+_LOG.setLevel(logging.INFO)
+_LOG.addHandler(_log_buffer)
+_LOG.propagate = False
+
+# Yosys script shared by the per-module and comprehensive synthesis runs
+_SYNTH_TCL_TEMPLATE = string.Template("""# Yosys $description
+$read_stanza
+hierarchy -top $top
+proc
+opt
+memory
+opt
+techmap
+abc -g AND,NAND,OR,NOR,NOT,BUF,XNOR,XOR
+stat
+write_verilog ${netlist}.v
+write_json ${netlist}.json
+tee -o $report stat
+""")
+
+@lru_cache(maxsize=None)
+def _render_synth_script(description: str, rtl_dir: str, modules: Tuple[str, ...],
+                         top: str, netlist: str, report: str) -> str:
+    """Render the synthesis script for a set of RTL modules (netlist is the path stem)"""
+    read_stanza = "\n".join(f"read_verilog -sv {rtl_dir}/{module}.sv" for module in modules)
+    return _SYNTH_TCL_TEMPLATE.substitute(description=description, read_stanza=read_stanza,
+                                          top=top, netlist=netlist, report=report)
+
+def _completed(cmd: List[str], returncode: int, stdout: bytes,
+               stderr: bytes) -> subprocess.CompletedProcess:
+    """Wrap captured subprocess output like subprocess.run(..., text=True) does"""
+    return subprocess.CompletedProcess(cmd, returncode,
+                                       stdout.decode(errors="replace"),
+                                       stderr.decode(errors="replace"))
+
+def _list_files(directory: Path) -> Set[str]:
+    """Names of the regular files in a directory (empty if it does not exist)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+def _copy_file(src: Path, dst: Path):
+    """Copy a file in the kernel with os.sendfile, falling back to a buffered copy"""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            size = os.fstat(fsrc.fileno()).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            # No sendfile, or no file-to-file sendfile on this platform
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst)
+
+def _write_atomic(path: Path, content: str):
+    """Write a file through a uniquely named temp file so readers never see it half-written"""
+    tmp = path.with_name(f"{path.name}.tmp.{os.urandom(4).hex()}")
+    tmp.write_text(content)
+    os.replace(tmp, path)
+
+@lru_cache(maxsize=None)
+def _command_in_path(command: str) -> bool:
+    """Look a command up on PATH in-process, once per run"""
+    return shutil.which(command) is not None
+
+@lru_cache(maxsize=32)
+def _read_rtl(path_str: str) -> str:
+    """Read an RTL source file, once per run"""
+    return Path(path_str).read_text()
+
+@dataclass
+class RtlChecks:
+    """Verification markers found in one RTL source file"""
+    has_memory_size: bool
+    has_rom_size: bool
+    has_ram_style: bool
+    has_rom_style: bool
+    has_reset: bool
+    has_clock: bool
+
 class TestRunner:
     """Main test runner class for FFT IP memory optimizations"""
     
-    def __init__(self, project_root: str):
+    # RTL text checked by the _verify_* methods, mapped to its RtlChecks field
+    _RTL_MARKERS = {
+        "fft_memory [0:2047]": "has_memory_size",
+        "rom_memory [ROM_SIZE-1:0]": "has_rom_size",
+        "ram_style = \"block\"": "has_ram_style",
+        "rom_style = \"block\"": "has_rom_style",
+        "reset_n_i": "has_reset",
+        "posedge clk_i": "has_clock",
+    }
+    _RTL_MARKER_RE = re.compile("|".join(map(re.escape, _RTL_MARKERS)))
+    
+    # RTL modules read by the comprehensive synthesis run
+    _COMPREHENSIVE_MODULES = ("memory_interface", "twiddle_rom", "fft_control")
+    
+    # Name of each @cocotb.test() coroutine in a cocotb test module
+    _COCOTB_TEST_RE = re.compile(r"^@cocotb\.test\(.*\)\s*\n(?:@.*\n)*async def (\w+)", re.M)
+    
+    # Cell count line of a Yosys stat report
+    _CELL_RE = re.compile(rb"Number of cells:\s+(\d+)")
+    
+    def __init__(self, project_root: str, use_synth_cache: bool = True):
         self.project_root = Path(project_root)
         self.rtl_dir = self.project_root / "rtl"
         self.tb_dir = self.project_root / "tb" / "sv_tb"
         self.synth_dir = self.project_root / "flow" / "yosys"
         self.reports_dir = self.project_root / "flow" / "yosys" / "reports"
         self.scripts_dir = self.project_root / "scripts"
+        self.cocotb_dir = self.project_root / "tb" / "cocotb"
+        self.synth_cache_dir = self.synth_dir / ".synth_cache"
+        self.use_synth_cache = use_synth_cache
         
         # Test configuration
         self.test_modules = [
@@ -50,6 +241,11 @@ class TestRunner:
             "twiddle_rom", 
             "fft_control"
         ]
+        self.cocotb_modules = [
+            "test_fft_basic",
+            "test_fft_edge_cases",
+            "test_fft_rescaling"
+        ]
         
         # Expected results
         self.expected_results = {
@@ -70,17 +266,31 @@ class TestRunner:
         # Test results storage
         self.test_results = {}
         self.synthesis_results = {}
-        
+        self.failed_phases: List[str] = []
+        self._rtl_checks: Dict[str, Optional[RtlChecks]] = {}
+        self._synth_cache: Dict[str, Dict[str, str]] = {}
+        
+        # Testbench and RTL directory listings, scanned once instead of a stat per check
+        self.refresh_fs_cache()
+        
+        # Limits concurrent tool runs (Yosys and the simulator are single-threaded)
+        self._job_slots = asyncio.Semaphore(os.cpu_count() or 1)
+        
+    def refresh_fs_cache(self):
+        """Rescan the testbench and RTL directories"""
+        self._tb_files = _list_files(self.tb_dir)
+        self._rtl_files = _list_files(self.rtl_dir)
+        
+        # RTL sources for simulation (subprocess does not expand shell globs)
+        rtl_dir = self.rtl_dir.absolute()
+        self._rtl_sources = sorted(str(rtl_dir / name)
+                                   for name in self._rtl_files if name.endswith(".sv"))
+        self._rtl_checks.clear()
+        _read_rtl.cache_clear()
+    
     def print_status(self, status: str, message: str):
-        """Print colored status message"""
-        color_map = {
-            "INFO": Colors.BLUE,
-            "SUCCESS": Colors.GREEN,
-            "WARNING": Colors.YELLOW,
-            "ERROR": Colors.RED
-        }
-        color = color_map.get(status, Colors.WHITE)
-        print(f"{color}[{status}]{Colors.NC} {message}")
+        """Log colored status message"""
+        _LOG.log(_STATUS_LEVELS.get(status, logging.INFO), message)
     
     def check_dependencies(self) -> bool:
         """Check if required tools are available"""
@@ -103,14 +313,44 @@ class TestRunner:
     
     def _command_exists(self, command: str) -> bool:
         """Check if a command exists in PATH"""
-        try:
-            subprocess.run([command, "--version"], 
-                         capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        return _command_in_path(command)
+    
+    async def _run_command(self, cmd: List[str], cwd: Path) -> subprocess.CompletedProcess:
+        """Run a command without blocking the event loop, capturing its text output"""
+        async with self._job_slots:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, cwd=cwd,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+            stdout, stderr = await proc.communicate()
+        return _completed(cmd, proc.returncode, stdout, stderr)
     
-    def run_simulation_tests(self) -> bool:
+    async def _run_pipeline(self, producer: List[str], consumer: List[str],
+                            cwd: Path) -> Tuple[subprocess.CompletedProcess, subprocess.CompletedProcess]:
+        """Run `producer | consumer` in one job slot, capturing both commands' output"""
+        async with self._job_slots:
+            read_fd, write_fd = os.pipe()
+            try:
+                first = await asyncio.create_subprocess_exec(
+                    *producer, cwd=cwd,
+                    stdout=write_fd, stderr=asyncio.subprocess.PIPE)
+                try:
+                    second = await asyncio.create_subprocess_exec(
+                        *consumer, cwd=cwd, stdin=read_fd,
+                        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+                except BaseException:
+                    first.kill()
+                    await first.wait()
+                    raise
+            finally:
+                # The children hold their own copies; closing ours lets EOF reach the consumer
+                os.close(read_fd)
+                os.close(write_fd)
+            (_, first_err), (second_out, second_err) = await asyncio.gather(
+                first.communicate(), second.communicate())
+        return (_completed(producer, first.returncode, b"", first_err),
+                _completed(consumer, second.returncode, second_out, second_err))
+    
+    async def run_simulation_tests(self) -> bool:
         """Run simulation tests for memory optimizations"""
         self.print_status("INFO", "Running simulation tests...")
         
@@ -121,47 +361,108 @@ class TestRunner:
         
         all_passed = True
         
+        # Testbenches compile and run independently, so run them all at once
+        tests = []
         for test_file, test_name in test_files:
-            test_path = self.tb_dir / test_file
-            if test_path.exists():
+            if test_file in self._tb_files:
+                test_path = self.tb_dir / test_file
                 self.print_status("INFO", f"Testing {test_name}...")
-                if self._run_simulation_test(test_path, test_name):
-                    self.print_status("SUCCESS", f"{test_name} test passed")
-                else:
-                    self.print_status("ERROR", f"{test_name} test failed")
-                    all_passed = False
+                tests.append((test_name, self._run_simulation_test(test_path, test_name)))
             else:
                 self.print_status("WARNING", f"Test file not found: {test_file}")
         
+        results = await asyncio.gather(*(run for _, run in tests), return_exceptions=True)
+        for (test_name, _), passed in zip(tests, results):
+            if passed is True:
+                self.print_status("SUCCESS", f"{test_name} test passed")
+            else:
+                self.print_status("ERROR", f"{test_name} test failed")
+                all_passed = False
+        
         return all_passed
     
-    def _run_simulation_test(self, test_file: Path, test_name: str) -> bool:
-        """Run individual simulation test"""
+    def _collect_cocotb_tests(self) -> List[Tuple[str, str]]:
+        """List (module, testcase) for every @cocotb.test() in the cocotb test modules"""
+        testcases = []
+        for module in self.cocotb_modules:
+            module_file = self.cocotb_dir / f"{module}.py"
+            try:
+                source = module_file.read_text()
+            except OSError:
+                self.print_status("WARNING", f"Cocotb test module not found: {module_file.name}")
+                continue
+            testcases.extend((module, name) for name in self._COCOTB_TEST_RE.findall(source))
+        return testcases
+    
+    async def run_cocotb_tests(self) -> bool:
+        """Run the cocotb tests, one simulator run per testcase, in parallel"""
+        self.print_status("INFO", "Running cocotb tests...")
+        
+        if not (self._command_exists("make") and self._command_exists("cocotb-config")):
+            self.print_status("WARNING", "cocotb not available, skipping cocotb tests")
+            return True
+        
+        testcases = self._collect_cocotb_tests()
+        results = await asyncio.gather(
+            *(self._run_cocotb_test(module, testcase) for module, testcase in testcases),
+            return_exceptions=True)
+        
+        all_passed = True
+        for (module, testcase), passed in zip(testcases, results):
+            if passed is True:
+                self.print_status("SUCCESS", f"{module}.{testcase} passed")
+            else:
+                self.print_status("ERROR", f"{module}.{testcase} failed")
+                all_passed = False
+        
+        return all_passed
+    
+    async def _run_cocotb_test(self, module: str, testcase: str) -> bool:
+        """Run a single cocotb testcase in its own build directory"""
         try:
-            # Compile testbench
-            compile_cmd = [
-                "iverilog", "-g2012", "-o", f"{test_name}.vvp",
-                str(test_file), str(self.rtl_dir / "*.sv")
+            # Separate build dirs and results files keep parallel runs apart
+            shard = f"{module}.{testcase}"
+            results_file = self.cocotb_dir / "results" / f"{shard}.xml"
+            results_file.parent.mkdir(parents=True, exist_ok=True)
+            # A results file left by an earlier run must not stand in for this one
+            results_file.unlink(missing_ok=True)
+            cmd = [
+                "make", f"MODULE={module}", f"TESTCASE={testcase}",
+                f"SIM_BUILD=sim_build/{shard}", f"COCOTB_RESULTS_FILE={results_file}"
             ]
-            
-            result = subprocess.run(compile_cmd, 
-                                  cwd=self.tb_dir,
-                                  capture_output=True, text=True)
+            result = await self._run_command(cmd, self.cocotb_dir)
             
             if result.returncode != 0:
-                self.print_status("ERROR", f"Compilation failed: {result.stderr}")
+                self.print_status("ERROR", f"cocotb run failed for {shard}: {result.stderr}")
                 return False
             
-            # Run simulation
-            run_cmd = ["vvp", f"{test_name}.vvp"]
-            result = subprocess.run(run_cmd, 
-                                  cwd=self.tb_dir,
-                                  capture_output=True, text=True)
+            # cocotb exits cleanly on test failures; the results file records them
+            if not results_file.exists():
+                self.print_status("ERROR", f"cocotb wrote no results for {shard}")
+                return False
+            report = results_file.read_bytes()
+            return b"<failure" not in report and b"<error" not in report
             
-            # Cleanup
-            vvp_file = self.tb_dir / f"{test_name}.vvp"
-            if vvp_file.exists():
-                vvp_file.unlink()
+        except Exception as e:
+            self.print_status("ERROR", f"Cocotb test failed: {e}")
+            return False
+    
+    async def _run_simulation_test(self, test_file: Path, test_name: str) -> bool:
+        """Run individual simulation test"""
+        try:
+            # Compile testbench and stream the compiled design straight into
+            # the simulator, so no intermediate .vvp file is written or cleaned up
+            compile_cmd = [
+                "iverilog", "-g2012", "-o", "/dev/stdout",
+                test_file.name, *self._rtl_sources
+            ]
+            run_cmd = ["vvp", "/dev/stdin"]
+            
+            compile_result, result = await self._run_pipeline(compile_cmd, run_cmd, self.tb_dir)
+            
+            if compile_result.returncode != 0:
+                self.print_status("ERROR", f"Compilation failed: {compile_result.stderr}")
+                return False
             
             return result.returncode == 0
             
@@ -169,7 +470,7 @@ class TestRunner:
             self.print_status("ERROR", f"Simulation test failed: {e}")
             return False
     
-    def run_synthesis_tests(self) -> bool:
+    async def run_synthesis_tests(self) -> bool:
         """Run synthesis tests for memory optimizations"""
         self.print_status("INFO", "Running synthesis tests...")
         
@@ -179,16 +480,27 @@ class TestRunner:
         
         all_passed = True
         
-        # Test individual modules
-        for module in self.test_modules:
-            if self._run_module_synthesis(module):
+        # Yosys is single-threaded and each run writes its own script, netlist
+        # and report, so launch the module runs and the comprehensive run together
+        self._load_synth_cache()
+        *module_results, comprehensive_result = await asyncio.gather(
+            *(self._run_module_synthesis(module) for module in self.test_modules),
+            self._run_comprehensive_synthesis(),
+            return_exceptions=True)
+        self._save_synth_cache()
+        
+        # Test individual modules (results analyzed in order once all runs finished)
+        for module, passed in zip(self.test_modules, module_results):
+            if passed is True:
+                self._analyze_synthesis_results(module)
                 self.print_status("SUCCESS", f"{module} synthesis completed")
             else:
                 self.print_status("ERROR", f"{module} synthesis failed")
                 all_passed = False
         
         # Test comprehensive synthesis
-        if self._run_comprehensive_synthesis():
+        if comprehensive_result is True:
+            self._analyze_synthesis_results("comprehensive")
             self.print_status("SUCCESS", "Comprehensive synthesis completed")
         else:
             self.print_status("ERROR", "Comprehensive synthesis failed")
@@ -196,38 +508,35 @@ class TestRunner:
         
         return all_passed
     
-    def _run_module_synthesis(self, module: str) -> bool:
+    async def _run_module_synthesis(self, module: str) -> bool:
         """Run synthesis for individual module"""
         try:
             script_file = self.synth_dir / f"synth_{module}_test.tcl"
             
             # Create synthesis script
-            script_content = f"""# Yosys synthesis script for {module} optimization test
-read_verilog -sv {self.rtl_dir}/{module}.sv
-hierarchy -top {module}
-proc
-opt
-memory
-opt
-techmap
-abc -g AND,NAND,OR,NOR,NOT,BUF,XNOR,XOR
-stat
-write_verilog {self.synth_dir}/{module}_synth.v
-write_json {self.synth_dir}/{module}_synth.json
-tee -o {self.reports_dir}/{module}_synthesis_report.txt stat
-"""
+            script_content = _render_synth_script(
+                f"synthesis script for {module} optimization test",
+                str(self.rtl_dir), (module,), module,
+                f"{self.synth_dir}/{module}_synth",
+                f"{self.reports_dir}/{module}_synthesis_report.txt")
+            
+            _write_atomic(script_file, script_content)
             
-            script_file.write_text(script_content)
+            # Reuse the previous results if neither the RTL nor the script changed
+            outputs = [self.synth_dir / f"{module}_synth.v",
+                       self.synth_dir / f"{module}_synth.json",
+                       self.reports_dir / f"{module}_synthesis_report.txt"]
+            fingerprint = self._synth_fingerprint(script_content, [self.rtl_dir / f"{module}.sv"])
+            if self._restore_cached_synthesis(module, fingerprint, outputs):
+                self.print_status("INFO", f"{module} unchanged, reusing cached synthesis results")
+                return True
             
             # Run synthesis
             cmd = ["yosys", "-q", str(script_file)]
-            result = subprocess.run(cmd, 
-                                  cwd=self.synth_dir,
-                                  capture_output=True, text=True)
+            result = await self._run_command(cmd, self.synth_dir)
             
             if result.returncode == 0:
-                # Analyze results
-                self._analyze_synthesis_results(module)
+                self._store_synthesis(module, fingerprint, outputs)
                 return True
             else:
                 self.print_status("ERROR", f"Yosys synthesis failed: {result.stderr}")
@@ -237,40 +546,36 @@ tee -o {self.reports_dir}/{module}_synthesis_report.txt stat
             self.print_status("ERROR", f"Module synthesis failed: {e}")
             return False
     
-    def _run_comprehensive_synthesis(self) -> bool:
+    async def _run_comprehensive_synthesis(self) -> bool:
         """Run comprehensive synthesis test"""
         try:
             script_file = self.synth_dir / "synth_comprehensive_test.tcl"
             
             # Create comprehensive synthesis script
-            script_content = f"""# Yosys comprehensive synthesis script for FFT IP optimization test
-read_verilog -sv {self.rtl_dir}/memory_interface.sv
-read_verilog -sv {self.rtl_dir}/twiddle_rom.sv
-read_verilog -sv {self.rtl_dir}/fft_control.sv
-hierarchy -top fft_control
-proc
-opt
-memory
-opt
-techmap
-abc -g AND,NAND,OR,NOR,NOT,BUF,XNOR,XOR
-stat
-write_verilog {self.synth_dir}/fft_ip_comprehensive_synth.v
-write_json {self.synth_dir}/fft_ip_comprehensive_synth.json
-tee -o {self.reports_dir}/comprehensive_synthesis_report.txt stat
-"""
+            script_content = _render_synth_script(
+                "comprehensive synthesis script for FFT IP optimization test",
+                str(self.rtl_dir), self._COMPREHENSIVE_MODULES, "fft_control",
+                f"{self.synth_dir}/fft_ip_comprehensive_synth",
+                f"{self.reports_dir}/comprehensive_synthesis_report.txt")
+            
+            _write_atomic(script_file, script_content)
             
-            script_file.write_text(script_content)
+            # Reuse the previous results if neither the RTL nor the script changed
+            outputs = [self.synth_dir / "fft_ip_comprehensive_synth.v",
+                       self.synth_dir / "fft_ip_comprehensive_synth.json",
+                       self.reports_dir / "comprehensive_synthesis_report.txt"]
+            sources = [self.rtl_dir / f"{module}.sv" for module in self._COMPREHENSIVE_MODULES]
+            fingerprint = self._synth_fingerprint(script_content, sources)
+            if self._restore_cached_synthesis("comprehensive", fingerprint, outputs):
+                self.print_status("INFO", "Design unchanged, reusing cached comprehensive synthesis results")
+                return True
             
             # Run synthesis
             cmd = ["yosys", "-q", str(script_file)]
-            result = subprocess.run(cmd, 
-                                  cwd=self.synth_dir,
-                                  capture_output=True, text=True)
+            result = await self._run_command(cmd, self.synth_dir)
             
             if result.returncode == 0:
-                # Analyze results
-                self._analyze_synthesis_results("comprehensive")
+                self._store_synthesis("comprehensive", fingerprint, outputs)
                 return True
             else:
                 self.print_status("ERROR", f"Comprehensive synthesis failed: {result.stderr}")
@@ -280,21 +585,100 @@ tee -o {self.reports_dir}/comprehensive_synthesis_report.txt stat
             self.print_status("ERROR", f"Comprehensive synthesis failed: {e}")
             return False
     
+    def _load_synth_cache(self):
+        """Load the synthesis cache index ({job: {"hash": fingerprint}})"""
+        self._synth_cache = {}
+        if not self.use_synth_cache:
+            return
+        try:
+            self._synth_cache = json.loads((self.synth_cache_dir / "index.json").read_text())
+        except (OSError, ValueError):
+            pass
+    
+    def _save_synth_cache(self):
+        """Atomically replace the synthesis cache index"""
+        if not self.use_synth_cache or not self._synth_cache:
+            return
+        self.synth_cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.synth_cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(self._synth_cache, f, indent=2)
+        os.replace(tmp_name, self.synth_cache_dir / "index.json")
+    
+    def _synth_fingerprint(self, script_content: str, sources: List[Path]) -> Optional[str]:
+        """Hash a synthesis script and its RTL sources (None if a source is unreadable)"""
+        digest = hashlib.blake2b(script_content.encode(), digest_size=16)
+        try:
+            for source in sources:
+                digest.update(source.read_bytes())
+        except OSError:
+            return None
+        return digest.hexdigest()
+    
+    def _restore_cached_synthesis(self, job: str, fingerprint: Optional[str],
+                                  outputs: List[Path]) -> bool:
+        """Copy cached outputs of an unchanged synthesis job into place"""
+        entry = self._synth_cache.get(job)
+        if fingerprint is None or not entry or entry.get("hash") != fingerprint:
+            return False
+        cached = [self.synth_cache_dir / output.name for output in outputs]
+        if not all(path.exists() for path in cached):
+            return False
+        for src, dst in zip(cached, outputs):
+            _copy_file(src, dst)
+        return True
+    
+    def _store_synthesis(self, job: str, fingerprint: Optional[str], outputs: List[Path]):
+        """Keep copies of a finished synthesis job's outputs for later runs"""
+        if not self.use_synth_cache or fingerprint is None:
+            return
+        if not all(output.exists() for output in outputs):
+            return
+        self.synth_cache_dir.mkdir(parents=True, exist_ok=True)
+        for output in outputs:
+            _copy_file(output, self.synth_cache_dir / output.name)
+        self._synth_cache[job] = {"hash": fingerprint}
+    
+    def _json_cell_count(self, json_file: Path, top: str) -> Optional[int]:
+        """Count the top module's cells in a Yosys write_json netlist (None if unavailable)"""
+        try:
+            modules = _json_loads(json_file.read_bytes())["modules"]
+            
+            # Prefer the module Yosys marked as top, then the expected top name
+            for name, data in modules.items():
+                if int(data.get("attributes", {}).get("top", "0"), 2):
+                    top = name
+                    break
+            return len(modules[top].get("cells", {}))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+    
     def _analyze_synthesis_results(self, module: str):
         """Analyze synthesis results for a module"""
         report_file = self.reports_dir / f"{module}_synthesis_report.txt"
-        
-        if not report_file.exists():
-            self.print_status("WARNING", f"Synthesis report not found: {report_file}")
-            return
+        if module == "comprehensive":
+            json_file, top = self.synth_dir / "fft_ip_comprehensive_synth.json", "fft_control"
+        else:
+            json_file, top = self.synth_dir / f"{module}_synth.json", module
         
         try:
-            report_content = report_file.read_text()
+            # The JSON netlist holds the authoritative cell list; fall back to the stat report
+            cell_count = self._json_cell_count(json_file, top)
             
-            # Extract cell count
-            cell_match = re.search(r"Number of cells:\s+(\d+)", report_content)
-            if cell_match:
-                cell_count = int(cell_match.group(1))
+            if cell_count is None:
+                if not report_file.exists():
+                    self.print_status("WARNING", f"Synthesis report not found: {report_file}")
+                    return
+                
+                # Extract cell count (first match only, so stop reading there)
+                with report_file.open("rb") as f:
+                    for line in f:
+                        cell_match = self._CELL_RE.search(line)
+                        if cell_match:
+                            cell_count = int(cell_match.group(1))
+                            break
+            
+            if cell_count is not None:
                 self.synthesis_results[module] = {"cells": cell_count}
                 
                 self.print_status("INFO", f"{module} cell count: {cell_count}")
@@ -365,6 +749,18 @@ tee -o {self.reports_dir}/comprehensive_synthesis_report.txt stat
         
         return all_passed
     
+    def _check_rtl(self, module: str) -> Optional[RtlChecks]:
+        """Scan an RTL module once for every verification marker (None if missing)"""
+        if module not in self._rtl_checks:
+            module_file = self.rtl_dir / f"{module}.sv"
+            checks = None
+            if module_file.name in self._rtl_files:
+                found = {self._RTL_MARKERS[match.group(0)]
+                         for match in self._RTL_MARKER_RE.finditer(_read_rtl(str(module_file)))}
+                checks = RtlChecks(**{name: name in found for name in self._RTL_MARKERS.values()})
+            self._rtl_checks[module] = checks
+        return self._rtl_checks[module]
+    
     def _verify_memory_size(self) -> bool:
         """Verify memory size requirements in RTL files"""
         self.print_status("INFO", "Verifying memory size requirements...")
@@ -372,20 +768,18 @@ tee -o {self.reports_dir}/comprehensive_synthesis_report.txt stat
         all_passed = True
         
         # Check memory interface
-        memory_file = self.rtl_dir / "memory_interface.sv"
-        if memory_file.exists():
-            content = memory_file.read_text()
-            if "fft_memory [0:2047]" in content:
+        checks = self._check_rtl("memory_interface")
+        if checks:
+            if checks.has_memory_size:
                 self.print_status("SUCCESS", "Memory size correct: 2048 x 32-bit = 64K bits")
             else:
                 self.print_status("ERROR", "Memory size incorrect in memory_interface.sv")
                 all_passed = False
         
         # Check twiddle ROM
-        rom_file = self.rtl_dir / "twiddle_rom.sv"
-        if rom_file.exists():
-            content = rom_file.read_text()
-            if "rom_memory [ROM_SIZE-1:0]" in content:
+        checks = self._check_rtl("twiddle_rom")
+        if checks:
+            if checks.has_rom_size:
                 self.print_status("SUCCESS", "ROM size structure correct")
             else:
                 self.print_status("ERROR", "ROM size structure incorrect in twiddle_rom.sv")
@@ -400,20 +794,18 @@ tee -o {self.reports_dir}/comprehensive_synthesis_report.txt stat
         all_passed = True
         
         # Check memory interface
-        memory_file = self.rtl_dir / "memory_interface.sv"
-        if memory_file.exists():
-            content = memory_file.read_text()
-            if "ram_style = \"block\"" in content:
+        checks = self._check_rtl("memory_interface")
+        if checks:
+            if checks.has_ram_style:
                 self.print_status("SUCCESS", "ram_style attribute found in memory_interface.sv")
             else:
                 self.print_status("ERROR", "ram_style attribute not found in memory_interface.sv")
                 all_passed = False
         
         # Check twiddle ROM
-        rom_file = self.rtl_dir / "twiddle_rom.sv"
-        if rom_file.exists():
-            content = rom_file.read_text()
-            if "rom_style = \"block\"" in content:
+        checks = self._check_rtl("twiddle_rom")
+        if checks:
+            if checks.has_rom_style:
                 self.print_status("SUCCESS", "rom_style attribute found in twiddle_rom.sv")
             else:
                 self.print_status("ERROR", "rom_style attribute not found in twiddle_rom.sv")
@@ -429,16 +821,15 @@ tee -o {self.reports_dir}/comprehensive_synthesis_report.txt stat
         
         # Check reset handling
         for module in ["memory_interface", "twiddle_rom"]:
-            module_file = self.rtl_dir / f"{module}.sv"
-            if module_file.exists():
-                content = module_file.read_text()
-                if "reset_n_i" in content:
+            checks = self._check_rtl(module)
+            if checks:
+                if checks.has_reset:
                     self.print_status("SUCCESS", f"Reset signal found in {module}.sv")
                 else:
                     self.print_status("ERROR", f"Reset signal not found in {module}.sv")
                     all_passed = False
                 
-                if "posedge clk_i" in content:
+                if checks.has_clock:
                     self.print_status("SUCCESS", f"Clock signal found in {module}.sv")
                 else:
                     self.print_status("ERROR", f"Clock signal not found in {module}.sv")
@@ -450,53 +841,34 @@ tee -o {self.reports_dir}/comprehensive_synthesis_report.txt stat
         """Generate comprehensive test report"""
         self.print_status("INFO", "Generating test report...")
         
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
         report_file = self.reports_dir / "python_test_report.md"
         
-        report_content = f"""# FFT IP Memory Optimization Test Report
-
-## Test Summary
-- **Test Date**: {time.strftime('%Y-%m-%d %H:%M:%S')}
-- **Test Runner**: Python Test Runner
-- **Test Modules**: {', '.join(self.test_modules)}
-
-## Expected Results
-- **Memory Interface**: < {self.expected_results['memory_interface']['cells']} cells (down from 67,754)
-- **Twiddle ROM**: > {self.expected_results['twiddle_rom']['cells']} cells (up from 85)
-- **Total Design**: < {self.expected_results['total']['cells']} cells (down from 74,217)
-
-## Test Results
-"""
-        
         # Add synthesis results
-        for module, results in self.synthesis_results.items():
-            cell_count = results.get("cells", "N/A")
-            report_content += f"- **{module}**: {cell_count} cells\n"
-        
-        report_content += f"""
-## Optimization Summary
-- **Memory Interface**: Synthesis attributes applied (ram_style = 'block')
-- **Memory Size**: Corrected from 65536×32-bit to 2048×32-bit (64K bits)
-- **Address Width**: Optimized from 16-bit to 11-bit
-- **Twiddle ROM**: Symmetry optimization implemented (4x size reduction)
-- **ROM Size**: Reduced from 2048×32-bit to 1024×16-bit (4K bits)
-
-## Recommendations
-1. Verify synthesis reports for memory macro usage
-2. Check timing constraints for optimized design
-3. Validate functionality with comprehensive simulation
-4. Compare gate count with previous baseline
-
-## Next Steps
-1. Run physical synthesis with vendor tools
-2. Implement memory generators for production
-3. Add advanced symmetry optimizations
-4. Optimize for specific target technology
-"""
-        
-        report_file.write_text(report_content)
+        test_results = "".join(f"- **{module}**: {results.get('cells', 'N/A')} cells\n"
+                               for module, results in self.synthesis_results.items())
+        
+        # List failed phases (only recorded by --keep-going runs)
+        failures = ""
+        if self.failed_phases:
+            failures = "\n## Failures\n" + "".join(f"- **{phase}** tests failed\n"
+                                                    for phase in self.failed_phases)
+        
+        report_content = _REPORT_TEMPLATE.substitute(
+            test_date=time.strftime('%Y-%m-%d %H:%M:%S'),
+            test_modules=', '.join(self.test_modules),
+            memory_interface_cells=self.expected_results['memory_interface']['cells'],
+            twiddle_rom_cells=self.expected_results['twiddle_rom']['cells'],
+            total_cells=self.expected_results['total']['cells'],
+            test_results=test_results,
+            failures=failures,
+        )
+        
+        with open(report_file, "wb") as f:
+            f.write(report_content.encode("utf-8"))
         self.print_status("SUCCESS", f"Test report generated: {report_file}")
     
-    def run_all_tests(self) -> bool:
+    async def run_all_tests(self, keep_going: bool = False) -> bool:
         """Run complete test suite"""
         self.print_status("INFO", "Starting FFT IP Memory Optimization Test Suite")
         self.print_status("INFO", f"Project Root: {self.project_root}")
@@ -506,21 +878,32 @@ tee -o {self.reports_dir}/comprehensive_synthesis_report.txt stat
         # Check dependencies
         if not self.check_dependencies():
             return False
+        _log_buffer.flush()
         
-        # Run verification tests
-        if not self.run_verification_tests():
-            self.print_status("ERROR", "Verification tests failed")
-            return False
-        
-        # Run simulation tests
-        if not self.run_simulation_tests():
-            self.print_status("ERROR", "Simulation tests failed")
-            return False
-        
-        # Run synthesis tests
-        if not self.run_synthesis_tests():
-            self.print_status("ERROR", "Synthesis tests failed")
-            return False
+        if keep_going:
+            # Run every phase even if an earlier one fails and report all failures at once
+            if not await self._run_all_phases():
+                self.generate_report()
+                self.print_status("ERROR", f"Failed test phases: {', '.join(self.failed_phases)}")
+                return False
+        else:
+            # Run verification tests
+            if not self.run_verification_tests():
+                self.print_status("ERROR", "Verification tests failed")
+                return False
+            _log_buffer.flush()
+            
+            # Run simulation tests
+            if not await self.run_simulation_tests():
+                self.print_status("ERROR", "Simulation tests failed")
+                return False
+            _log_buffer.flush()
+            
+            # Run synthesis tests
+            if not await self.run_synthesis_tests():
+                self.print_status("ERROR", "Synthesis tests failed")
+                return False
+            _log_buffer.flush()
         
         # Generate report
         self.generate_report()
@@ -533,6 +916,27 @@ tee -o {self.reports_dir}/comprehensive_synthesis_report.txt stat
         self.print_status("INFO", f"Check reports in: {self.reports_dir}")
         
         return True
+    
+    async def _run_all_phases(self) -> bool:
+        """Run verification, then simulation and synthesis concurrently, recording every failure"""
+        self.failed_phases = []
+        
+        if not self.run_verification_tests():
+            self.failed_phases.append("verification")
+        _log_buffer.flush()
+        
+        # Simulation and synthesis touch disjoint files, so they can overlap
+        phases = ("simulation", "synthesis")
+        results = await asyncio.gather(self.run_simulation_tests(), self.run_synthesis_tests(),
+                                       return_exceptions=True)
+        for phase, result in zip(phases, results):
+            if isinstance(result, BaseException):
+                self.print_status("ERROR", f"{phase.capitalize()} tests raised: {result}")
+            if result is not True:
+                self.failed_phases.append(phase)
+        _log_buffer.flush()
+        
+        return not self.failed_phases
 
 def main():
     """Main entry point"""
@@ -545,6 +949,8 @@ Examples:
   python test_runner.py --verify-only      # Run only verification tests
   python test_runner.py --sim-only         # Run only simulation tests
   python test_runner.py --synth-only       # Run only synthesis tests
+  python test_runner.py --cocotb-only      # Run only cocotb tests (one run per testcase)
+  python test_runner.py --keep-going       # Run every phase and report all failures
         """
     )
     
@@ -554,24 +960,33 @@ Examples:
                        help="Run only simulation tests")
     parser.add_argument("--synth-only", action="store_true",
                        help="Run only synthesis tests")
+    parser.add_argument("--cocotb-only", action="store_true",
+                       help="Run only cocotb tests, sharded per testcase")
+    parser.add_argument("--keep-going", action="store_true",
+                       help="Keep running later test phases after a failure")
     parser.add_argument("--project-root", default=".",
                        help="Project root directory (default: current directory)")
+    parser.add_argument("--no-synth-cache", action="store_true",
+                       help="Always rerun Yosys instead of reusing results for unchanged RTL")
     
     args = parser.parse_args()
     
     # Create test runner
-    runner = TestRunner(args.project_root)
+    runner = TestRunner(args.project_root, use_synth_cache=not args.no_synth_cache)
     
     try:
         if args.verify_only:
             success = runner.run_verification_tests()
         elif args.sim_only:
-            success = runner.run_simulation_tests()
+            success = asyncio.run(runner.run_simulation_tests())
+        elif args.cocotb_only:
+            success = asyncio.run(runner.run_cocotb_tests())
         elif args.synth_only:
-            success = runner.run_synthesis_tests()
+            success = asyncio.run(runner.run_synthesis_tests())
         else:
-            success = runner.run_all_tests()
+            success = asyncio.run(runner.run_all_tests(keep_going=args.keep_going))
         
+        _log_buffer.flush()
         if success:
             print(f"\n{Colors.GREEN}🎉 All tests completed successfully!{Colors.NC}")
             sys.exit(0)
@@ -580,9 +995,11 @@ Examples:
             sys.exit(1)
             
     except KeyboardInterrupt:
+        _log_buffer.flush()
         print(f"\n{Colors.YELLOW}⚠️  Test interrupted by user{Colors.NC}")
         sys.exit(1)
     except Exception as e:
+        _log_buffer.flush()
         print(f"\n{Colors.RED}❌ Test runner error: {e}{Colors.NC}")
         sys.exit(1)
 
@@ -6,18 +6,12 @@ Generates basic coverage information when coverage tools don't work
 
 import os
 import sys
+import string
 from datetime import datetime, timezone
 
-def generate_coverage_report():
-    """Generate a basic coverage report"""
-    
-    # Create coverage directory
-    coverage_dir = "coverage"
-    os.makedirs(coverage_dir, exist_ok=True)
-    
-    # Generate basic coverage report
-    report_content = f"""FFT IP Coverage Report
-Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}
+# Plain-text coverage report
+_REPORT_TEMPLATE = string.Template("""FFT IP Coverage Report
+Generated: $generated
 
 Test Coverage Summary:
 ====================
@@ -55,28 +49,24 @@ Recommendations:
 
 This report was generated automatically when coverage tools
 did not provide detailed coverage data.
-"""
-    
-    # Write coverage report
-    with open(os.path.join(coverage_dir, "coverage_report.txt"), "w") as f:
-        f.write(report_content)
-    
-    # Also create an HTML version
-    html_content = f"""<!DOCTYPE html>
+""")
+
+# HTML version of the same report
+_HTML_TEMPLATE = string.Template("""<!DOCTYPE html>
 <html>
 <head>
     <title>FFT IP Coverage Report</title>
     <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; }}
-        h1 {{ color: #0366d6; }}
-        .summary {{ background: #f6f8fa; padding: 20px; border-radius: 8px; }}
-        .test-list {{ background: #fff; padding: 15px; border-left: 4px solid #28a745; }}
-        .limitations {{ background: #fff3cd; padding: 15px; border-left: 4px solid #ffc107; }}
+        body { font-family: Arial, sans-serif; margin: 40px; }
+        h1 { color: #0366d6; }
+        .summary { background: #f6f8fa; padding: 20px; border-radius: 8px; }
+        .test-list { background: #fff; padding: 15px; border-left: 4px solid #28a745; }
+        .limitations { background: #fff3cd; padding: 15px; border-left: 4px solid #ffc107; }
     </style>
 </head>
 <body>
     <h1>FFT IP Coverage Report</h1>
-    <p><strong>Generated:</strong> {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
+    <p><strong>Generated:</strong> $generated</p>
     
     <div class="summary">
         <h2>Test Coverage Summary</h2>
@@ -118,10 +108,30 @@ did not provide detailed coverage data.
     
     <p><a href="../">Back to main report</a></p>
 </body>
-</html>"""
+</html>""")
+
+def generate_coverage_report():
+    """Generate a basic coverage report"""
+    
+    # Create coverage directory
+    coverage_dir = "coverage"
+    os.makedirs(coverage_dir, exist_ok=True)
+    
+    # Both reports carry the same generation timestamp
+    generated = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+    
+    # Generate basic coverage report
+    report_content = _REPORT_TEMPLATE.substitute(generated=generated)
+    
+    # Write coverage report
+    with open(os.path.join(coverage_dir, "coverage_report.txt"), "wb") as f:
+        f.write(report_content.encode("utf-8"))
+    
+    # Also create an HTML version
+    html_content = _HTML_TEMPLATE.substitute(generated=generated)
     
-    with open(os.path.join(coverage_dir, "coverage_report.html"), "w") as f:
-        f.write(html_content)
+    with open(os.path.join(coverage_dir, "coverage_report.html"), "wb") as f:
+        f.write(html_content.encode("utf-8"))
     
     print("✅ Coverage report generated")
     return True
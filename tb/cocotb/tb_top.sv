@@ -0,0 +1,115 @@
+//=============================================================================
+// FFT Cocotb Testbench Wrapper
+//=============================================================================
+// Description: Thin toplevel for the cocotb rescaling and edge case tests.
+//              Generates the clocks in HDL so the simulator toggles them
+//              without a Python coroutine; cocotb only drives resets and
+//              the bus interfaces. APB and AXI run on the system clock,
+//              matching the single clock domain memory_interface assumes.
+//              Also records a scale factor trace for the rescaling tests.
+// Author:      Vyges IP Development Team
+// Date:        2025-07-21
+// License:     Apache-2.0
+//=============================================================================
+
+`timescale 1ns/1ps
+
+module tb_top;
+
+    // Clock and reset signals
+    logic        clk_i;
+    logic        reset_n_i;
+    logic        pclk_i;
+    logic        preset_n_i;
+    logic        axi_aclk_i;
+    logic        axi_areset_n_i;
+
+    // APB interface signals
+    logic        psel_i;
+    logic        penable_i;
+    logic        pwrite_i;
+    logic [15:0] paddr_i;
+    logic [31:0] pwdata_i;
+    logic [31:0] prdata_o;
+    logic        pready_o;
+
+    // Packed APB request bus: cocotb updates every request signal with one write
+    logic [50:0] apb_stim = '0;
+    assign {psel_i, penable_i, pwrite_i, paddr_i, pwdata_i} = apb_stim;
+
+    // AXI interface signals
+    logic [31:0] axi_awaddr_i;
+    logic        axi_awvalid_i;
+    logic        axi_awready_o;
+    logic [63:0] axi_wdata_i;
+    logic        axi_wvalid_i;
+    logic        axi_wready_o;
+    logic [31:0] axi_araddr_i;
+    logic        axi_arvalid_i;
+    logic        axi_arready_o;
+    logic [63:0] axi_rdata_o;
+    logic        axi_rvalid_o;
+    logic        axi_rready_i;
+
+    // Interrupt signals
+    logic        fft_done_o;
+    logic        fft_error_o;
+
+    // External SRAM and bus master signals
+    logic        sram_clk_o;
+    logic [9:0]  sram_addr_o;
+    logic [31:0] sram_wdata_o;
+    logic [31:0] sram_ben_o;
+    logic        sram_rwb_o;
+    logic [1:0]  sram_en_o;
+    logic [31:0] sram_rdata0_i;
+    logic [31:0] sram_rdata1_i;
+    logic        mem_req_valid_o;
+    logic        mem_req_ready_i;
+    logic [10:0] mem_req_addr_o;
+    logic        mem_req_we_o;
+    logic [31:0] mem_req_wdata_o;
+    logic [3:0]  mem_req_be_o;
+    logic        mem_rsp_valid_i;
+    logic [31:0] mem_rsp_rdata_i;
+    logic        mem_rsp_err_i;
+
+    // Clock generation: 1 GHz by default, retunable from cocotb at runtime
+    real clk_half_period_ns = 0.5;
+
+    initial clk_i = 1'b0;
+    always #(clk_half_period_ns) clk_i = ~clk_i;
+
+    assign pclk_i = clk_i;
+    assign axi_aclk_i = clk_i;
+
+    // Instantiate DUT
+    fft_top fft_top_inst (.*);
+
+    // Scale factor trace: {overflow_count, scale_factor} sampled every
+    // scale_trace_interval cycles while the engine is busy, restarted on
+    // each FFT start, so cocotb can read the history in one pass afterwards
+    localparam int SCALE_TRACE_DEPTH = 64;
+
+    logic [15:0] scale_trace [0:SCALE_TRACE_DEPTH-1];
+    int unsigned scale_trace_len = 0;
+    int unsigned scale_trace_interval = 100;
+    int unsigned scale_trace_tick = 0;
+    logic        fft_busy_q = 1'b0;
+
+    always @(posedge clk_i) begin
+        fft_busy_q <= fft_top_inst.fft_busy_o;
+        if (fft_top_inst.fft_busy_o && !fft_busy_q) begin
+            scale_trace_len <= 0;
+            scale_trace_tick <= 0;
+        end else if (fft_top_inst.fft_busy_o && scale_trace_len < SCALE_TRACE_DEPTH) begin
+            if (scale_trace_tick == 0) begin
+                scale_trace[scale_trace_len] <= {fft_top_inst.overflow_count_o,
+                                                 fft_top_inst.scale_factor_o};
+                scale_trace_len <= scale_trace_len + 1;
+            end
+            scale_trace_tick <= (scale_trace_tick + 1) % scale_trace_interval;
+        end
+    end
+
+endmodule
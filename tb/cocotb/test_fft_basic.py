@@ -15,23 +15,30 @@ from cocotb.clock import Clock
 # Test parameters
 CLOCK_PERIOD = 10  # 10ns = 100MHz
 
+async def drive_clocks(period_ns, *clocks):
+    """Toggle several in-phase clocks of the same period from a single coroutine"""
+    half_period = period_ns / 2
+    while True:
+        for clk in clocks:
+            clk.value = 1
+        await Timer(half_period, units="ns")
+        for clk in clocks:
+            clk.value = 0
+        await Timer(half_period, units="ns")
+
+def init_apb_zero(dut):
+    """Drive the APB request signals to 0 immediately, without scheduling separate writes"""
+    for name in ("psel_i", "penable_i", "pwrite_i", "paddr_i", "pwdata_i"):
+        getattr(dut, name).setimmediatevalue(0)
+
 @cocotb.test()
 async def test_fft_minimal(dut):
     """Minimal test that just verifies the design compiles and runs"""
     
     print("🚀 Starting minimal FFT test...")
     
-    # Start clock
-    clock = Clock(dut.clk_i, CLOCK_PERIOD, units="ns")
-    cocotb.start_soon(clock.start())
-    
-    # Start APB clock
-    pclock = Clock(dut.pclk_i, CLOCK_PERIOD, units="ns")
-    cocotb.start_soon(pclock.start())
-    
-    # Start AXI clock
-    axiclock = Clock(dut.axi_aclk_i, CLOCK_PERIOD, units="ns")
-    cocotb.start_soon(axiclock.start())
+    # Start system, APB and AXI clocks (same period, so one coroutine drives all three)
+    cocotb.start_soon(drive_clocks(CLOCK_PERIOD, dut.clk_i, dut.pclk_i, dut.axi_aclk_i))
     
     print("✅ Clocks started")
     
@@ -79,11 +86,7 @@ async def test_fft_signal_check(dut):
     print(f"   reset_n_i: {reset_val}")
     
     # Check APB signals
-    dut.psel_i.value = 0
-    dut.penable_i.value = 0
-    dut.pwrite_i.value = 0
-    dut.paddr_i.value = 0
-    dut.pwdata_i.value = 0
+    init_apb_zero(dut)
     
     print("✅ Signal accessibility test completed")
     
@@ -10,24 +10,14 @@
 #=============================================================================
 
 import cocotb
-from cocotb.triggers import RisingEdge, FallingEdge, Timer
-from cocotb.clock import Clock
-from cocotb.handle import ModifiableObject
-import random
 import numpy as np
-from scipy import signal
 
-# Test parameters
-CLOCK_PERIOD = 1  # 1ns = 1GHz
+# Clocks are generated in tb_top.sv (1ns = 1GHz by default)
 
 @cocotb.test()
 async def test_rescaling_modes(dut):
     """Test different rescaling modes"""
     
-    # Start clock
-    clock = Clock(dut.clk_i, CLOCK_PERIOD, units="ns")
-    cocotb.start_soon(clock.start())
-    
     # Reset the design
     await reset_dut(dut)
     
@@ -41,10 +31,6 @@ async def test_rescaling_modes(dut):
 async def test_overflow_detection(dut):
     """Test overflow detection with various input patterns"""
     
-    # Start clock
-    clock = Clock(dut.clk_i, CLOCK_PERIOD, units="ns")
-    cocotb.start_soon(clock.start())
-    
     # Reset the design
     await reset_dut(dut)
     
@@ -62,7 +48,10 @@ async def test_overflow_detection(dut):
     ]
     
     for pattern_name, test_data in test_patterns:
-        dut._log.info(f"Testing overflow pattern: {pattern_name}")
+        dut._log.debug("Testing overflow pattern: %s", pattern_name)
+        
+        # Return the engine to idle, keeping rescaling and scale tracking enabled
+        await soft_reset(dut, ctrl=0x30)
         
         # Load test data
         await load_input_data(dut, test_data)
@@ -81,16 +70,13 @@ async def test_overflow_detection(dut):
         assert scale_factor >= 0, f"Scale factor should be non-negative for {pattern_name}"
         assert overflow_status['overflow_count'] >= 0, f"Overflow count should be non-negative for {pattern_name}"
         
-        dut._log.info(f"Pattern {pattern_name}: Scale factor = {scale_factor}, Overflow count = {overflow_status['overflow_count']}")
+        dut._log.debug("Pattern %s: Scale factor = %d, Overflow count = %d",
+                       pattern_name, scale_factor, overflow_status['overflow_count'])
 
 @cocotb.test()
 async def test_scale_factor_tracking(dut):
     """Test scale factor tracking accuracy"""
     
-    # Start clock
-    clock = Clock(dut.clk_i, CLOCK_PERIOD, units="ns")
-    cocotb.start_soon(clock.start())
-    
     # Reset the design
     await reset_dut(dut)
     
@@ -105,24 +91,13 @@ async def test_scale_factor_tracking(dut):
     # Start FFT computation
     await start_fft(dut)
     
-    # Monitor scale factor during computation
-    scale_factors = []
-    overflow_counts = []
-    
-    # Sample during computation
-    for _ in range(50):  # Sample 50 times during computation
-        await Timer(100, units="ns")
-        try:
-            scale_factor = await read_scale_factor(dut)
-            overflow_status = await read_overflow_status(dut)
-            scale_factors.append(scale_factor)
-            overflow_counts.append(overflow_status['overflow_count'])
-        except:
-            pass  # Ignore read errors during computation
-    
     # Wait for completion
     await wait_for_completion(dut)
     
+    # Scale factor history sampled by the tb_top monitor while the engine was busy
+    trace = [int(dut.scale_trace[i].value) for i in range(int(dut.scale_trace_len.value))]
+    scale_factors = [t & 0xFF for t in trace]
+    
     # Final values
     final_scale_factor = await read_scale_factor(dut)
     final_overflow_status = await read_overflow_status(dut)
@@ -140,10 +115,6 @@ async def test_scale_factor_tracking(dut):
 async def test_rounding_modes(dut):
     """Test different rounding modes in rescaling"""
     
-    # Start clock
-    clock = Clock(dut.clk_i, CLOCK_PERIOD, units="ns")
-    cocotb.start_soon(clock.start())
-    
     # Reset the design
     await reset_dut(dut)
     
@@ -161,10 +132,6 @@ async def test_rounding_modes(dut):
 async def test_saturation_arithmetic(dut):
     """Test saturation arithmetic in rescaling"""
     
-    # Start clock
-    clock = Clock(dut.clk_i, CLOCK_PERIOD, units="ns")
-    cocotb.start_soon(clock.start())
-    
     # Reset the design
     await reset_dut(dut)
     
@@ -182,10 +149,6 @@ async def test_saturation_arithmetic(dut):
 async def test_rescaling_thresholds(dut):
     """Test different rescaling thresholds"""
     
-    # Start clock
-    clock = Clock(dut.clk_i, CLOCK_PERIOD, units="ns")
-    cocotb.start_soon(clock.start())
-    
     # Reset the design
     await reset_dut(dut)
     
@@ -197,7 +160,10 @@ async def test_rescaling_thresholds(dut):
     thresholds = [1, 2, 4, 8, 16]
     
     for threshold in thresholds:
-        dut._log.info(f"Testing rescaling threshold: {threshold}")
+        dut._log.debug("Testing rescaling threshold: %d", threshold)
+        
+        # Return the engine to idle, keeping rescaling and scale tracking enabled
+        await soft_reset(dut, ctrl=0x30)
         
         # Set threshold
         await set_rescaling_threshold(dut, threshold)
@@ -216,7 +182,8 @@ async def test_rescaling_thresholds(dut):
         scale_factor = await read_scale_factor(dut)
         overflow_status = await read_overflow_status(dut)
         
-        dut._log.info(f"Threshold {threshold}: Scale factor = {scale_factor}, Overflow count = {overflow_status['overflow_count']}")
+        dut._log.debug("Threshold %d: Scale factor = %d, Overflow count = %d",
+                       threshold, scale_factor, overflow_status['overflow_count'])
 
 # Helper functions for rescaling tests
 
@@ -243,7 +210,8 @@ async def test_rescaling_mode_0(dut):
     overflow_status = await read_overflow_status(dut)
     
     assert scale_factor >= 0, "Scale factor should be non-negative in mode 0"
-    dut._log.info(f"Mode 0 results: Scale factor = {scale_factor}, Overflow count = {overflow_status['overflow_count']}")
+    dut._log.info("Mode 0 results: Scale factor = %d, Overflow count = %d",
+                  scale_factor, overflow_status['overflow_count'])
 
 async def test_rescaling_mode_1(dut):
     """Test rescaling mode 1: Divide by N at end"""
@@ -268,11 +236,12 @@ async def test_rescaling_mode_1(dut):
     overflow_status = await read_overflow_status(dut)
     
     assert scale_factor >= 0, "Scale factor should be non-negative in mode 1"
-    dut._log.info(f"Mode 1 results: Scale factor = {scale_factor}, Overflow count = {overflow_status['overflow_count']}")
+    dut._log.info("Mode 1 results: Scale factor = %d, Overflow count = %d",
+                  scale_factor, overflow_status['overflow_count'])
 
 async def test_rounding_mode(dut, rounding_mode, mode_name):
     """Test specific rounding mode"""
-    dut._log.info(f"Testing rounding mode: {mode_name}")
+    dut._log.info("Testing rounding mode: %s", mode_name)
     
     # Configure rounding mode
     await configure_fft(dut, fft_length_log2=8, fft_length=256)
@@ -292,11 +261,12 @@ async def test_rounding_mode(dut, rounding_mode, mode_name):
     scale_factor = await read_scale_factor(dut)
     overflow_status = await read_overflow_status(dut)
     
-    dut._log.info(f"{mode_name} results: Scale factor = {scale_factor}, Overflow count = {overflow_status['overflow_count']}")
+    dut._log.info("%s results: Scale factor = %d, Overflow count = %d",
+                  mode_name, scale_factor, overflow_status['overflow_count'])
 
 async def test_saturation_mode(dut, saturation_enabled, mode_name):
     """Test saturation mode"""
-    dut._log.info(f"Testing saturation mode: {mode_name}")
+    dut._log.info("Testing saturation mode: %s", mode_name)
     
     # Configure saturation mode
     await configure_fft(dut, fft_length_log2=8, fft_length=256)
@@ -316,48 +286,44 @@ async def test_saturation_mode(dut, saturation_enabled, mode_name):
     scale_factor = await read_scale_factor(dut)
     overflow_status = await read_overflow_status(dut)
     
-    dut._log.info(f"{mode_name} results: Scale factor = {scale_factor}, Overflow count = {overflow_status['overflow_count']}")
+    dut._log.info("%s results: Scale factor = %d, Overflow count = %d",
+                  mode_name, scale_factor, overflow_status['overflow_count'])
 
 # Configuration functions
 
+def rescale_writes(config):
+    """Register writes enabling rescaling with the given FFT_CONFIG value"""
+    return (
+        (0x0000, 0x30),    # FFT_CTRL: Enable rescaling and scale tracking
+        (0x0008, config),  # FFT_CONFIG: Mode bits, overflow detection
+        (0x0020, 0x0F),    # RESCALE_CTRL: Enable all rescaling features
+    )
+
+# Write sequences for each configuration variant, built once at import
+RESCALING_MODE_WRITES = {
+    0: rescale_writes(0x80008),  # Mode 0: Divide by 2 each stage
+    1: rescale_writes(0x90008),  # Mode 1: Divide by N at end
+}
+ROUNDING_MODE_WRITES = {
+    0: rescale_writes(0x80008),  # Truncate mode
+    1: rescale_writes(0x82008),  # Round mode
+}
+SATURATION_WRITES = {
+    0: rescale_writes(0x80008),  # Without saturation
+    1: rescale_writes(0x84008),  # With saturation
+}
+
 async def enable_rescaling_mode(dut, mode):
     """Enable rescaling with specific mode"""
-    await apb_write(dut, 0x0000, 0x30)  # FFT_CTRL: Enable rescaling and scale tracking
-    
-    if mode == 0:
-        # Mode 0: Divide by 2 each stage
-        await apb_write(dut, 0x0008, 0x80008)  # FFT_CONFIG: Mode 0, overflow detection
-    else:
-        # Mode 1: Divide by N at end
-        await apb_write(dut, 0x0008, 0x90008)  # FFT_CONFIG: Mode 1, overflow detection
-    
-    await apb_write(dut, 0x0020, 0x0F)  # RESCALE_CTRL: Enable all rescaling features
+    await apb_write_many(dut, RESCALING_MODE_WRITES[int(mode != 0)])
 
 async def enable_rescaling_with_rounding(dut, rounding_mode):
     """Enable rescaling with specific rounding mode"""
-    await apb_write(dut, 0x0000, 0x30)  # FFT_CTRL: Enable rescaling and scale tracking
-    
-    if rounding_mode == 0:
-        # Truncate mode
-        await apb_write(dut, 0x0008, 0x80008)  # FFT_CONFIG: Truncate, overflow detection
-    else:
-        # Round mode
-        await apb_write(dut, 0x0008, 0x82008)  # FFT_CONFIG: Round, overflow detection
-    
-    await apb_write(dut, 0x0020, 0x0F)  # RESCALE_CTRL: Enable all rescaling features
+    await apb_write_many(dut, ROUNDING_MODE_WRITES[int(rounding_mode != 0)])
 
 async def enable_rescaling_with_saturation(dut, saturation_enabled):
     """Enable rescaling with saturation"""
-    await apb_write(dut, 0x0000, 0x30)  # FFT_CTRL: Enable rescaling and scale tracking
-    
-    if saturation_enabled:
-        # With saturation
-        await apb_write(dut, 0x0008, 0x84008)  # FFT_CONFIG: Saturation, overflow detection
-    else:
-        # Without saturation
-        await apb_write(dut, 0x0008, 0x80008)  # FFT_CONFIG: No saturation, overflow detection
-    
-    await apb_write(dut, 0x0020, 0x0F)  # RESCALE_CTRL: Enable all rescaling features
+    await apb_write_many(dut, SATURATION_WRITES[int(bool(saturation_enabled))])
 
 async def set_rescaling_threshold(dut, threshold):
     """Set rescaling threshold"""
@@ -379,14 +345,13 @@ def generate_alternating_data(length):
             data.append(complex(0.1, 0.1))
     return data
 
-def generate_random_large_data(length):
-    """Generate data with random large values"""
-    data = []
-    for _ in range(length):
-        real_part = random.uniform(0.7, 0.9) * (1 if random.random() > 0.5 else -1)
-        imag_part = random.uniform(0.7, 0.9) * (1 if random.random() > 0.5 else -1)
-        data.append(complex(real_part, imag_part))
-    return data
+def generate_random_large_data(length, seed=0):
+    """Generate data with random large values (seeded, so runs are reproducible)"""
+    rng = np.random.default_rng(seed)
+    magnitude = rng.uniform(0.7, 0.9, size=(2, length))
+    sign = np.where(rng.random(size=(2, length)) > 0.5, 1.0, -1.0)
+    real_part, imag_part = magnitude * sign
+    return (real_part + 1j * imag_part).astype(np.complex64)
 
 def generate_impulse_data(length):
     """Generate impulse data"""
@@ -396,45 +361,34 @@ def generate_impulse_data(length):
 
 def generate_chirp_data(length):
     """Generate chirp signal data"""
-    data = []
-    for i in range(length):
-        freq = 0.1 + 0.8 * i / length  # Chirp from 0.1 to 0.9
-        phase = 2 * np.pi * freq * i
-        real_part = 0.8 * np.cos(phase)
-        imag_part = 0.8 * np.sin(phase)
-        data.append(complex(real_part, imag_part))
-    return data
+    i = np.arange(length)
+    freq = 0.1 + 0.8 * i / length  # Chirp from 0.1 to 0.9
+    phase = 2 * np.pi * freq * i
+    return (0.8 * np.cos(phase) + 0.8j * np.sin(phase)).astype(np.complex64)
 
 def generate_known_overflow_data(length):
     """Generate data with known overflow characteristics"""
-    data = []
-    for i in range(length):
-        # Create pattern that will cause predictable overflow
-        if i < length // 4:
-            data.append(complex(0.9, 0.9))
-        elif i < length // 2:
-            data.append(complex(-0.9, -0.9))
-        elif i < 3 * length // 4:
-            data.append(complex(0.9, -0.9))
-        else:
-            data.append(complex(-0.9, 0.9))
-    return data
+    # Create pattern that will cause predictable overflow: one quadrant per quarter
+    i = np.arange(length)
+    real_part = np.where((i < length // 4) | ((i >= length // 2) & (i < 3 * length // 4)), 0.9, -0.9)
+    imag_part = np.where(i < length // 2, real_part, -real_part)
+    return (real_part + 1j * imag_part).astype(np.complex64)
 
 def generate_threshold_test_data(length, threshold):
     """Generate data for threshold testing"""
-    data = []
-    for i in range(length):
-        # Create data that will trigger rescaling at specific threshold
-        magnitude = 0.5 + 0.4 * (i % threshold) / threshold
-        phase = 2 * np.pi * i / length
-        real_part = magnitude * np.cos(phase)
-        imag_part = magnitude * np.sin(phase)
-        data.append(complex(real_part, imag_part))
-    return data
+    # Create data that will trigger rescaling at specific threshold
+    i = np.arange(length)
+    magnitude = 0.5 + 0.4 * (i % threshold) / threshold
+    phase = 2 * np.pi * i / length
+    return (magnitude * np.cos(phase) + 1j * magnitude * np.sin(phase)).astype(np.complex64)
+
+def generate_overflow_data(length):
+    """Generate data that overflows without rescaling"""
+    return generate_known_overflow_data(length)
 
-# Import common functions from basic test
-from test_fft_basic import (
-    reset_dut, configure_fft, enable_rescaling_full, load_input_data,
+# Import common functions from edge case test
+from test_fft_edge_cases import (
+    reset_dut, soft_reset, configure_fft, enable_rescaling_full, load_input_data,
     start_fft, wait_for_completion, read_scale_factor, read_overflow_status,
-    apb_write, apb_read, generate_overflow_data
+    apb_write, apb_write_many
 ) 
\ No newline at end of file